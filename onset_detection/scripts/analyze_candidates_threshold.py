@@ -74,8 +74,8 @@ current_cands, current_axes = count_candidates_with_thresholds(features_df, curr
 print(f"Candidates: {len(current_cands):,}개")
 
 # 급등 구간 포함 여부
-surge1_in = len(current_cands[current_cands['ts'].between(surge1_start - 30000, surge1_start + 30000)]) > 0
-surge2_in = len(current_cands[current_cands['ts'].between(surge2_start - 30000, surge2_start + 30000)]) > 0
+surge1_in = current_cands['ts'].between(surge1_start - 30000, surge1_start + 30000).any()
+surge2_in = current_cands['ts'].between(surge2_start - 30000, surge2_start + 30000).any()
 print(f"Surge 1 포함: {surge1_in}")
 print(f"Surge 2 포함: {surge2_in}")
 
@@ -86,8 +86,8 @@ print("=" * 60)
 proposed_cands_2axes, proposed_axes_2 = count_candidates_with_thresholds(features_df, proposed_thresholds, min_axes=2)
 print(f"Candidates: {len(proposed_cands_2axes):,}개 (감소율: {(1 - len(proposed_cands_2axes)/len(current_cands))*100:.1f}%)")
 
-surge1_in = len(proposed_cands_2axes[proposed_cands_2axes['ts'].between(surge1_start - 30000, surge1_start + 30000)]) > 0
-surge2_in = len(proposed_cands_2axes[proposed_cands_2axes['ts'].between(surge2_start - 30000, surge2_start + 30000)]) > 0
+surge1_in = proposed_cands_2axes['ts'].between(surge1_start - 30000, surge1_start + 30000).any()
+surge2_in = proposed_cands_2axes['ts'].between(surge2_start - 30000, surge2_start + 30000).any()
 print(f"Surge 1 포함: {surge1_in}")
 print(f"Surge 2 포함: {surge2_in}")
 
@@ -98,8 +98,8 @@ print("=" * 60)
 proposed_cands_3axes, proposed_axes_3 = count_candidates_with_thresholds(features_df, proposed_thresholds, min_axes=3)
 print(f"Candidates: {len(proposed_cands_3axes):,}개 (감소율: {(1 - len(proposed_cands_3axes)/len(current_cands))*100:.1f}%)")
 
-surge1_in = len(proposed_cands_3axes[proposed_cands_3axes['ts'].between(surge1_start - 30000, surge1_start + 30000)]) > 0
-surge2_in = len(proposed_cands_3axes[proposed_cands_3axes['ts'].between(surge2_start - 30000, surge2_start + 30000)]) > 0
+surge1_in = proposed_cands_3axes['ts'].between(surge1_start - 30000, surge1_start + 30000).any()
+surge2_in = proposed_cands_3axes['ts'].between(surge2_start - 30000, surge2_start + 30000).any()
 print(f"Surge 1 포함: {surge1_in}")
 print(f"Surge 2 포함: {surge2_in}")
 
@@ -75,8 +75,8 @@ if not fp_df.empty:
         print(f"  {hour:02d}h: {count}")
 
     # 장 초반 vs 후반
-    morning = len(fp_df[fp_df['hour'] < 12])
-    afternoon = len(fp_df[fp_df['hour'] >= 12])
+    morning = int((fp_df['hour'] < 12).sum())
+    afternoon = int((fp_df['hour'] >= 12).sum())
     print(f"\nMorning (09-12h): {morning} ({morning/len(fp_df)*100:.1f}%)")
     print(f"Afternoon (12-15h): {afternoon} ({afternoon/len(fp_df)*100:.1f}%)")
 
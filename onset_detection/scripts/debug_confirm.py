@@ -45,8 +45,8 @@ def debug_confirm():
     print(f"   Std: {df['ret_1s'].std():.6f}")
     print(f"   Min: {df['ret_1s'].min():.6f}")
     print(f"   Max: {df['ret_1s'].max():.6f}")
-    print(f"   Values > 0.1: {len(df[df['ret_1s'] > 0.1])} (should be 0 after clipping)")
-    print(f"   Values < -0.1: {len(df[df['ret_1s'] < -0.1])} (should be 0 after clipping)")
+    print(f"   Values > 0.1: {(df['ret_1s'] > 0.1).sum()} (should be 0 after clipping)")
+    print(f"   Values < -0.1: {(df['ret_1s'] < -0.1).sum()} (should be 0 after clipping)")
 
     # 4. Candidate  
     print(f"\n  Candidate Detection:")
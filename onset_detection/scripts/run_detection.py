@@ -49,8 +49,8 @@ def run_detection():
     print(f"  Std: {df['ret_1s'].std():.6f}")
     print(f"  Min: {df['ret_1s'].min():.6f}")
     print(f"  Max: {df['ret_1s'].max():.6f}")
-    print(f"  Values > 0.1: {len(df[df['ret_1s'] > 0.1])}")
-    print(f"  Values < -0.1: {len(df[df['ret_1s'] < -0.1])}")
+    print(f"  Values > 0.1: {(df['ret_1s'] > 0.1).sum()}")
+    print(f"  Values < -0.1: {(df['ret_1s'] < -0.1).sum()}")
 
     # 4. Candidate Detection
     print(f"\n" + "=" * 70)
@@ -83,6 +83,7 @@ class FeaturesConfig(BaseModel):
         "vol_window": 300,
         "price_window": 600
     })
+    incremental_live: bool = Field(default=False)
 
 
 class SessionConfig(BaseModel):
@@ -100,6 +101,8 @@ class VisualConfig(BaseModel):
     show_stages: bool = Field(default=True)
     debug_labels: bool = Field(default=False)
     timeline_panel: bool = Field(default=True)
+    downsample: bool = Field(default=True)
+    downsample_min_points: int = Field(default=5000)
 
 
 class SegmenterConfig(BaseModel):
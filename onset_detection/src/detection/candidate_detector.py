@@ -2,7 +2,7 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional, Sequence
 from pathlib import Path
 from math import inf
 
@@ -86,79 +86,119 @@ class CandidateDetector:
             raise ValueError(f"Missing required columns for detection: {missing_cols}")
         
         for idx, row in features_df.iterrows():
-            # Extract indicators
-            ret_1s = row['ret_1s']
-            accel_1s = row['accel_1s']
-            z_vol_1s = row['z_vol_1s']
-            ticks_per_sec = row['ticks_per_sec']
-
-            # Skip if any indicator is NaN or invalid
-            if pd.isna(ret_1s) or pd.isna(accel_1s) or pd.isna(z_vol_1s) or pd.isna(ticks_per_sec):
-                continue
+            candidate_event = self.detect_row(row)
+            if candidate_event is not None:
+                candidates.append(candidate_event)
+        
+        return candidates
+    
+    def detect_row(self, row: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Evaluate a single feature row.
 
-            # --- CPD 게이트(선행) ---
-            # 게이트를 통과해야만 후보 산출 로직으로 진입
-            ts_ms = row.get('ts', 0)
-            if self._cpd_use and not self._cpd_update_and_check(ts_ms, row):
-                continue
+        ``detect_candidates`` runs this for every row; live callers that only
+        score the newest tick can pass its values directly instead of a
+        one-row DataFrame.
 
-            # Detection Only: Absolute threshold based trigger_axes evaluation
-            trigger_axes = []
-
-            # Speed axis
-            if ret_1s > self.absolute_thresholds["ret_1s"]:
-                trigger_axes.append("speed")
-
-            # Participation axis
-            if z_vol_1s > self.absolute_thresholds["z_vol"]:
-                trigger_axes.append("participation")
-
-            # Friction axis - check spread with priority fallback
-            spread_value = None
-            if 'spread' in row and pd.notna(row['spread']):
-                spread_value = row['spread']
-            elif 'ask1' in row and 'bid1' in row and pd.notna(row['ask1']) and pd.notna(row['bid1']):
-                spread_value = row['ask1'] - row['bid1']
-
-            if spread_value is not None:
-                # Assume spread_baseline is average spread or use current as reference
-                # For Detection Only, use simplified narrowing check
-                spread_baseline = spread_value * 1.5  # Baseline = 1.5x current spread
-                if spread_value < spread_baseline * self.absolute_thresholds["spread_narrowing_pct"]:
-                    trigger_axes.append("friction")
-
-            # Check if min_axes_required is met
-            if len(trigger_axes) < self.min_axes_required:
-                continue
+        Args:
+            row: Feature values keyed by column name (dict or pd.Series), with
+                at least the columns detect_candidates requires.
 
-            # Calculate weighted score (kept for compatibility)
-            score = (
-                self.weights["ret"] * ret_1s +
-                self.weights["accel"] * accel_1s +
-                self.weights["z_vol"] * z_vol_1s +
-                self.weights["ticks"] * ticks_per_sec
-            )
+        Returns:
+            Optional[Dict]: Onset candidate event, or None if the row does not qualify.
+        """
+        # Extract indicators
+        ret_1s = row['ret_1s']
+        accel_1s = row['accel_1s']
+        z_vol_1s = row['z_vol_1s']
+        ticks_per_sec = row['ticks_per_sec']
 
-            # Create candidate event with trigger_axes
-            candidate_event = create_event(
-                timestamp=row['ts'],
-                event_type="onset_candidate",
-                stock_code=str(row['stock_code']),
-                score=float(score),
-                evidence={
-                    "ret_1s": float(ret_1s),
-                    "accel_1s": float(accel_1s),
-                    "z_vol_1s": float(z_vol_1s),
-                    "ticks_per_sec": int(ticks_per_sec),
-                    "trigger_axes": trigger_axes,
-                    "price": float(row.get('price', 0)),
-                    "volume": float(row.get('volume', 0))
-                }
-            )
+        # Skip if any indicator is NaN or invalid
+        if pd.isna(ret_1s) or pd.isna(accel_1s) or pd.isna(z_vol_1s) or pd.isna(ticks_per_sec):
+            return None
 
-            candidates.append(candidate_event)
-        
-        return candidates
+        # --- CPD 게이트(선행) ---
+        # 게이트를 통과해야만 후보 산출 로직으로 진입
+        ts_ms = row.get('ts', 0)
+        if self._cpd_use and not self._cpd_update_and_check(ts_ms, row):
+            return None
+
+        # Detection Only: Absolute threshold based trigger_axes evaluation
+        trigger_axes = []
+
+        # Speed axis
+        if ret_1s > self.absolute_thresholds["ret_1s"]:
+            trigger_axes.append("speed")
+
+        # Participation axis
+        if z_vol_1s > self.absolute_thresholds["z_vol"]:
+            trigger_axes.append("participation")
+
+        # Friction axis - check spread with priority fallback
+        spread_value = None
+        if 'spread' in row and pd.notna(row['spread']):
+            spread_value = row['spread']
+        elif 'ask1' in row and 'bid1' in row and pd.notna(row['ask1']) and pd.notna(row['bid1']):
+            spread_value = row['ask1'] - row['bid1']
+
+        if spread_value is not None:
+            # Assume spread_baseline is average spread or use current as reference
+            # For Detection Only, use simplified narrowing check
+            spread_baseline = spread_value * 1.5  # Baseline = 1.5x current spread
+            if spread_value < spread_baseline * self.absolute_thresholds["spread_narrowing_pct"]:
+                trigger_axes.append("friction")
+
+        # Check if min_axes_required is met
+        if len(trigger_axes) < self.min_axes_required:
+            return None
+
+        # Calculate weighted score (kept for compatibility)
+        score = (
+            self.weights["ret"] * ret_1s +
+            self.weights["accel"] * accel_1s +
+            self.weights["z_vol"] * z_vol_1s +
+            self.weights["ticks"] * ticks_per_sec
+        )
+
+        # Create candidate event with trigger_axes
+        candidate_event = create_event(
+            timestamp=row['ts'],
+            event_type="onset_candidate",
+            stock_code=str(row['stock_code']),
+            score=float(score),
+            evidence={
+                "ret_1s": float(ret_1s),
+                "accel_1s": float(accel_1s),
+                "z_vol_1s": float(z_vol_1s),
+                "ticks_per_sec": int(ticks_per_sec),
+                "trigger_axes": trigger_axes,
+                "price": float(row.get('price', 0)),
+                "volume": float(row.get('volume', 0))
+            }
+        )
+
+        return candidate_event
+    
+    def detect_from_array(
+        self,
+        values: Sequence[float],
+        names: Sequence[str],
+        context: Optional[Mapping[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Evaluate a single feature vector.
+
+        Args:
+            values: Indicator values, e.g. from a compiled kernel.
+            names: Column name of each value.
+            context: Raw tick fields (ts, stock_code, price, ...) the event needs.
+
+        Returns:
+            Optional[Dict]: Onset candidate event, or None if the row does not qualify.
+        """
+        row = dict(context) if context is not None else {}
+        row.update(zip(names, values))
+        return self.detect_row(row)
     
     def save_candidates(self, candidates: List[Dict[str, Any]], filename: Optional[str] = None) -> bool:
         """
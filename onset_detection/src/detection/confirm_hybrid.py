@@ -150,14 +150,16 @@ class HybridConfirmDetector(ConfirmDetector):
                 else:
                     confirm_ts = float(confirm_ts)
 
+                onset_strength = confirmation_result.get("onset_strength", 0.5)
                 confirmed_event = create_event(
                     timestamp=confirm_ts,
                     event_type="onset_confirmed",
                     stock_code=str(stock_code),
                     confirmed_from=float(candidate_ts),
+                    onset_strength=onset_strength,  # Top-level copy for the trading hot path
                     evidence={
                         "axes": confirmation_result["satisfied_axes"],
-                        "onset_strength": confirmation_result.get("onset_strength", 0.5),
+                        "onset_strength": onset_strength,
                         "hybrid_used": self.use_hybrid,
                         "ml_threshold": self.ml_threshold,
                         "ret_1s": confirmation_result["evidence"]["ret_1s"],
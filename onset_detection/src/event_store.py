@@ -1,6 +1,7 @@
 """Event store for managing onset detection events."""
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
@@ -94,6 +95,96 @@ class EventStore:
             print(f"Error saving event: {e}")
             return False
     
+    def save_events(
+        self,
+        events: List[Dict[str, Any]],
+        filename: Optional[str] = None,
+        validate: bool = True,
+        fsync: bool = False
+    ) -> int:
+        """
+        Save a batch of events to JSONL file with a single open/write.
+        
+        Args:
+            events: Event dictionaries to save.
+            filename: Optional filename. If None, uses default.
+            validate: Whether to validate event structure.
+            fsync: Whether to fsync the file after writing (also done for an
+                empty batch, to flush earlier unsynced writes).
+            
+        Returns:
+            int: Number of events saved.
+            
+        Raises:
+            ValueError: If event validation fails (nothing is written).
+        """
+        if not events and not fsync:
+            return 0
+        
+        events, lines = self._serialize_events(events, validate)
+        
+        try:
+            with open(self._resolve_file(filename), 'a', encoding='utf-8') as f:
+                f.write(lines)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            
+            # Update statistics
+            for event in events:
+                self._update_stats(event)
+            
+            return len(events)
+            
+        except Exception as e:
+            print(f"Error saving events: {e}")
+            return 0
+    
+    def appender(self, filename: Optional[str] = None, validate: bool = True) -> "EventAppender":
+        """
+        Open a long-lived appender for batched writes.
+        
+        Args:
+            filename: Optional filename. If None, uses default.
+            validate: Whether to validate event structure.
+            
+        Returns:
+            EventAppender: Appender holding the file open until closed.
+        """
+        return EventAppender(self, self._resolve_file(filename), validate)
+    
+    def _resolve_file(self, filename: Optional[str]) -> Path:
+        """Get the JSONL path for a filename (default file if None)."""
+        if filename is None:
+            return self.default_file
+        return self.events_dir / filename
+    
+    def _serialize_events(self, events: List[Dict[str, Any]], validate: bool) -> tuple:
+        """
+        Validate events, stamp saved_at and encode them as JSONL.
+        
+        Returns:
+            tuple: (stamped events, JSONL text).
+            
+        Raises:
+            ValueError: If event validation fails.
+        """
+        if validate:
+            for event in events:
+                self._validate_event(event)
+        
+        # Add metadata if not present
+        saved_at = time.time()
+        events = [
+            event if 'saved_at' in event else {**event, 'saved_at': saved_at}
+            for event in events
+        ]
+        lines = ''.join(
+            json.dumps(event, default=str, separators=(',', ':')) + '\n'
+            for event in events
+        )
+        return events, lines
+    
     def load_events(
         self, 
         filename: Optional[str] = None,
@@ -306,6 +397,75 @@ class EventStore:
         return event_type_counts
 
 
+class EventAppender:
+    """
+    Append-only JSONL writer that keeps one file descriptor open.
+    
+    Intended for long-running writer threads: each write() is a single
+    os.write on an O_APPEND descriptor (no open/close per batch), and sync()
+    uses fdatasync where the platform has it.
+    """
+    
+    def __init__(self, store: EventStore, file_path: Path, validate: bool = True):
+        """
+        Initialize appender.
+        
+        Args:
+            store: EventStore whose validation and statistics are used.
+            file_path: JSONL file to append to.
+            validate: Whether to validate event structure.
+        """
+        self.store = store
+        self.file_path = file_path
+        self.validate = validate
+        self._fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    
+    def write(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Append a batch of events.
+        
+        Args:
+            events: Event dictionaries to save.
+            
+        Returns:
+            int: Number of events written.
+            
+        Raises:
+            ValueError: If event validation fails (nothing is written).
+        """
+        if not events:
+            return 0
+        events, lines = self.store._serialize_events(events, self.validate)
+        
+        data = memoryview(lines.encode('utf-8'))
+        while data:
+            written = os.write(self._fd, data)
+            data = data[written:]
+        
+        for event in events:
+            self.store._update_stats(event)
+        return len(events)
+    
+    def sync(self) -> None:
+        """Flush written events to stable storage."""
+        if hasattr(os, 'fdatasync'):
+            os.fdatasync(self._fd)
+        else:
+            os.fsync(self._fd)
+    
+    def close(self) -> None:
+        """Close the file descriptor."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+    
+    def __enter__(self) -> "EventAppender":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 def create_event(
     timestamp: Union[int, float, datetime],
     event_type: str,
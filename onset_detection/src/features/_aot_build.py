@@ -0,0 +1,42 @@
+"""Ahead-of-time build of the live indicator kernels.
+
+Compiles the kernels in ``_live_kernels`` into the ``_indicators_aot``
+extension module next to this file, so a live process can start without a
+first-call JIT compile. Requires numba with ``numba.pycc``:
+
+    python -m src.features._aot_build
+
+``_live_kernels`` picks up the extension when it imports and falls back to
+``@njit`` otherwise; rebuild after changing the kernels.
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from ._live_kernels import _clipped_log_return, _microprice, latest_features
+
+cc = CC('_indicators_aot')
+cc.output_dir = str(Path(__file__).parent)
+
+
+@cc.export('latest_features', 'f8[:](f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], i8[:], b1, i8)')
+def _latest_features(price, volume, bid1, ask1, bid_qty1, ask_qty1, ts_sec,
+                     is_cumulative, vol_window):
+    return latest_features(price, volume, bid1, ask1, bid_qty1, ask_qty1, ts_sec,
+                           is_cumulative, vol_window)
+
+
+@cc.export('clipped_log_return', 'f8(f8, f8)')
+def _clipped_log_return_aot(p_now, p_prev):
+    return _clipped_log_return(p_now, p_prev)
+
+
+@cc.export('microprice', 'f8(f8, f8, f8, f8)')
+def _microprice_aot(bid, ask, bid_qty, ask_qty):
+    return _microprice(bid, ask, bid_qty, ask_qty)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
@@ -0,0 +1,270 @@
+"""Latest-row core indicator kernels for live tick processing.
+
+Replicates the per-row formulas of ``CoreIndicators`` for the newest tick only,
+operating on raw NumPy arrays. Compiled with numba when it is installed, or
+ahead of time by ``_aot_build``; callers should use the ``live_*`` bindings,
+check ``COMPILED_KERNELS_AVAILABLE`` and keep the pandas path otherwise, since
+the plain-Python loops are not faster than the vectorized version.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Order of the values returned by latest_features
+LATEST_FEATURE_NAMES = (
+    'ret_1s', 'accel_1s', 'vol_1s', 'ticks_per_sec', 'z_vol_1s',
+    'spread', 'microprice', 'microprice_slope'
+)
+_N_FEATURES = len(LATEST_FEATURE_NAMES)
+
+
+@njit(cache=True)
+def _clipped_log_return(p_now, p_prev):
+    ret = np.log(p_now / p_prev)
+    if ret < -0.1:
+        return -0.1
+    if ret > 0.1:
+        return 0.1
+    return ret
+
+
+@njit(cache=True)
+def _microprice(bid, ask, bid_qty, ask_qty):
+    total_qty = ask_qty + bid_qty
+    if total_qty == 0:
+        total_qty = 1.0
+    return (bid * ask_qty + ask * bid_qty) / total_qty
+
+
+@njit(cache=True)
+def latest_features(price, volume, bid1, ask1, bid_qty1, ask_qty1, ts_sec,
+                    is_cumulative, vol_window):
+    """
+    Compute core indicators for the last row of a chronological tick window.
+
+    Args:
+        price, volume, bid1, ask1, bid_qty1, ask_qty1: float64 arrays, oldest first.
+        ts_sec: int64 epoch seconds per tick.
+        is_cumulative: Whether volume is cumulative (per-tick volume is its diff).
+        vol_window: Rolling window, in seconds, for the volume z-score.
+
+    Returns:
+        np.ndarray: float64 values in LATEST_FEATURE_NAMES order, NaNs filled
+            with 0 as CoreIndicators does.
+    """
+    n = price.shape[0]
+    out = np.zeros(_N_FEATURES, dtype=np.float64)
+    if n == 0:
+        return out
+
+    # Price: clipped log return and its change
+    ret = np.nan
+    accel = np.nan
+    if n >= 2:
+        ret = _clipped_log_return(price[n - 1], price[n - 2])
+        if n >= 3:
+            accel = ret - _clipped_log_return(price[n - 2], price[n - 3])
+
+    # Volume: per-tick volume summed per second, z-scored over the last seconds
+    secs = np.unique(ts_sec)
+    n_secs = secs.shape[0]
+    vol_1s = np.zeros(n_secs, dtype=np.float64)
+    ticks = np.zeros(n_secs, dtype=np.float64)
+    for i in range(n):
+        g = np.searchsorted(secs, ts_sec[i])
+        if is_cumulative:
+            vol_tick = volume[i] - volume[i - 1] if i > 0 else 0.0
+            if not vol_tick > 0:  # clip(lower=0) and fillna(0)
+                vol_tick = 0.0
+        else:
+            vol_tick = volume[i] if volume[i] == volume[i] else 0.0
+        vol_1s[g] += vol_tick
+        ticks[g] += 1.0
+
+    g_last = np.searchsorted(secs, ts_sec[n - 1])
+    start = max(0, g_last - vol_window + 1)
+    n_win = g_last - start + 1
+    z_vol = 0.0
+    if n_win >= 10:
+        window = vol_1s[start:g_last + 1]
+        mean = window.mean()
+        std = np.sqrt(((window - mean) ** 2).sum() / (n_win - 1))
+        if std == 0 or std != std:
+            std = 1.0
+        z_vol = (vol_1s[g_last] - mean) / std
+
+    # Friction: spread and microprice
+    spread = (ask1[n - 1] - bid1[n - 1]) / ((ask1[n - 1] + bid1[n - 1]) / 2)
+    micro = _microprice(bid1[n - 1], ask1[n - 1], bid_qty1[n - 1], ask_qty1[n - 1])
+    micro_slope = np.nan
+    if n >= 2:
+        micro_slope = micro - _microprice(bid1[n - 2], ask1[n - 2], bid_qty1[n - 2], ask_qty1[n - 2])
+
+    out[0] = ret
+    out[1] = accel
+    out[2] = vol_1s[g_last]
+    out[3] = ticks[g_last]
+    out[4] = z_vol
+    out[5] = spread
+    out[6] = micro
+    out[7] = micro_slope
+    for i in range(out.shape[0]):
+        if out[i] != out[i]:
+            out[i] = 0.0
+    return out
+
+
+class RollingSecondVolume:
+    """
+    Per-second volume statistics over a sliding tick window, updated in O(1).
+
+    Mirrors the volume indicators of ``CoreIndicators`` evaluated over a buffer
+    of the most recent ticks: per-tick volume (diff of cumulative volume, with
+    the buffer's first tick counting 0), summed per second, and z-scored
+    against the last ``vol_window`` seconds. Running sums are adjusted as
+    ticks enter and leave instead of re-aggregating the buffer.
+
+    Requires non-decreasing timestamps; ``valid`` turns False on a tick that
+    goes back in time, after which the owner should rebuild from its buffer.
+    """
+
+    # Re-sum the window from scratch this often to shed float drift
+    RESUM_EVERY = 1000
+
+    def __init__(self, vol_window: int, is_cumulative: bool = True):
+        """
+        Initialize rolling volume statistics.
+
+        Args:
+            vol_window: Rolling window, in seconds, for the volume z-score.
+            is_cumulative: Whether volume is cumulative.
+        """
+        self.vol_window = vol_window
+        self.is_cumulative = is_cumulative
+        self.valid = True
+        self._ticks = deque()   # [sec, vol_tick] per buffered tick
+        self._groups = deque()  # [sec, vol_1s, n_ticks] per second in window
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._last_volume = math.nan
+        self._updates = 0
+
+    def _adjust(self, group: list, d_vol: float, d_ticks: int):
+        old = group[1]
+        new = old + d_vol
+        group[1] = new
+        group[2] += d_ticks
+        self._sum += new - old
+        self._sum_sq += new * new - old * old
+
+        self._updates += 1
+        if self._updates >= self.RESUM_EVERY:
+            self._updates = 0
+            self._sum = math.fsum(g[1] for g in self._groups)
+            self._sum_sq = math.fsum(g[1] * g[1] for g in self._groups)
+
+    def push(self, sec: int, volume: float):
+        """
+        Add the newest tick.
+
+        Args:
+            sec: Epoch second of the tick.
+            volume: Raw volume field of the tick.
+        """
+        groups = self._groups
+        if groups and sec < groups[-1][0]:
+            self.valid = False
+
+        if self.is_cumulative:
+            vol_tick = volume - self._last_volume if self._ticks else 0.0
+            if not vol_tick > 0:  # clip(lower=0) and fillna(0)
+                vol_tick = 0.0
+        else:
+            vol_tick = volume if volume == volume else 0.0
+        self._last_volume = volume
+        self._ticks.append([sec, vol_tick])
+
+        if not groups or groups[-1][0] != sec:
+            groups.append([sec, 0.0, 0])
+            while len(groups) > self.vol_window:
+                dropped = groups.popleft()
+                self._sum -= dropped[1]
+                self._sum_sq -= dropped[1] * dropped[1]
+        self._adjust(groups[-1], vol_tick, 1)
+
+    def evict(self):
+        """Remove the oldest tick (call before pushing into a full buffer)."""
+        if not self._ticks:
+            return
+        groups = self._groups
+        sec, vol_tick = self._ticks.popleft()
+        if groups and groups[0][0] == sec:
+            self._adjust(groups[0], -vol_tick, -1)
+            if groups[0][2] == 0:
+                empty = groups.popleft()
+                self._sum -= empty[1]
+                self._sum_sq -= empty[1] * empty[1]
+
+        # The new first tick has no predecessor in the buffer: its diff is 0
+        if self.is_cumulative and self._ticks and self._ticks[0][1] != 0.0:
+            first = self._ticks[0]
+            if groups and groups[0][0] == first[0]:
+                self._adjust(groups[0], -first[1], 0)
+            first[1] = 0.0
+
+    def latest(self) -> tuple:
+        """
+        Statistics for the newest tick's second.
+
+        Returns:
+            tuple: (vol_1s, ticks_per_sec, z_vol_1s).
+        """
+        if not self._groups:
+            return 0.0, 0.0, 0.0
+        _, vol_1s, n_ticks = self._groups[-1]
+        n = len(self._groups)
+        z_vol = 0.0
+        if n >= 10:
+            mean = self._sum / n
+            var = (self._sum_sq - n * mean * mean) / (n - 1)
+            std = math.sqrt(var) if var > 0 else 0.0
+            # Relative tolerance: a constant window leaves only rounding noise
+            if std <= 1e-12 * max(abs(mean), 1.0):
+                std = 1.0
+            z_vol = (vol_1s - mean) / std
+        return vol_1s, float(n_ticks), z_vol
+
+
+# Kernels for the live path: the ahead-of-time build (see _aot_build) when it
+# has been compiled, so a live process starts without JIT compiling, otherwise
+# the @njit versions above
+try:
+    from ._indicators_aot import (
+        latest_features as live_latest_features,
+        clipped_log_return as live_clipped_log_return,
+        microprice as live_microprice
+    )
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+    live_latest_features = latest_features
+    live_clipped_log_return = _clipped_log_return
+    live_microprice = _microprice
+
+# Whether live_latest_features runs compiled (and beats the pandas path)
+COMPILED_KERNELS_AVAILABLE = NUMBA_AVAILABLE or AOT_AVAILABLE
@@ -30,13 +30,15 @@ class CoreIndicators:
         self.is_cumulative_volume = getattr(self.config.volume, 'is_cumulative', True)
         self.vol_roll_window_s = getattr(self.config.volume, 'roll_window_s', 300)
     
-    def add_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_indicators(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Add core indicators to the DataFrame.
         
         Args:
             df: Input DataFrame with columns [ts, stock_code, price, volume, 
                 bid1, ask1, bid_qty1, ask_qty1]
+            copy: Copy the input first. Pass False for a throwaway frame the
+                caller doesn't reuse; it may then gain indicator columns.
         
         Returns:
             pd.DataFrame: DataFrame with added indicator columns.
@@ -45,7 +47,7 @@ class CoreIndicators:
             return df
         
         # Create a copy to avoid modifying original
-        result_df = df.copy()
+        result_df = df.copy() if copy else df
         
         # Add timestamp processing
         result_df = self._add_timestamp_features(result_df)
@@ -181,19 +183,24 @@ class CoreIndicators:
         return df
 
 
-def calculate_core_indicators(df: pd.DataFrame, config: Optional[Config] = None) -> pd.DataFrame:
+def calculate_core_indicators(
+    df: pd.DataFrame,
+    config: Optional[Config] = None,
+    copy: bool = True
+) -> pd.DataFrame:
     """
     Convenience function to calculate core indicators.
     
     Args:
         df: Input DataFrame with tick data.
         config: Optional configuration object.
+        copy: Copy the input first (see CoreIndicators.add_indicators).
     
     Returns:
         pd.DataFrame: DataFrame with added indicator columns.
     """
     calculator = CoreIndicators(config)
-    return calculator.add_indicators(df)
+    return calculator.add_indicators(df, copy=copy)
 
 
 if __name__ == "__main__":
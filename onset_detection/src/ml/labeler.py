@@ -8,8 +8,17 @@ from typing import Dict, Any, List, Optional, Tuple, Union
 import yaml
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# orjson parses bytes directly; stdlib json accepts bytes too
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 def load_ml_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
     """
@@ -34,12 +43,17 @@ def load_ml_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str,
     return config.get('ml', {})
 
 
-def load_events_from_jsonl(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+def load_events_from_jsonl(
+    file_path: Union[str, Path],
+    event_type: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Load events from JSONL file.
 
     Args:
         file_path: Path to JSONL file with events.
+        event_type: If given, only events of this type are returned. Lines
+            that do not mention the type are skipped without being parsed.
 
     Returns:
         List[Dict]: List of event dictionaries.
@@ -50,15 +64,23 @@ def load_events_from_jsonl(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
     if not file_path.exists():
         raise FileNotFoundError(f"Events file not found: {file_path}")
 
-    with open(file_path, 'r') as f:
+    type_token = f'"{event_type}"'.encode() if event_type is not None else None
+
+    with open(file_path, 'rb') as f:
         for line in f:
             line = line.strip()
-            if line:
-                try:
-                    event = json.loads(line)
-                    events.append(event)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse JSON line: {line[:50]}... Error: {e}")
+            if not line:
+                continue
+            if type_token is not None and type_token not in line:
+                continue
+            try:
+                event = _json_loads(line)
+            except json.JSONDecodeError as e:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                logger.warning(f"Failed to parse JSON line: {line[:50].decode(errors='replace')}... Error: {e}")
+                continue
+            if event_type is None or event.get('event_type') == event_type:
+                events.append(event)
 
     logger.info(f"Loaded {len(events)} events from {file_path}")
     return events
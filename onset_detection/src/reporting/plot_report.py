@@ -3,8 +3,11 @@
 import json
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # File output only; never initialize a GUI backend
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union, Tuple
@@ -13,6 +16,166 @@ from ..config_loader import Config, load_config
 from ..event_store import EventStore
 from ..utils.paths import PathManager
 
+try:
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Report category -> event_type, in int8 type-code order
+EVENT_CATEGORIES = (
+    ('candidates', 'onset_candidate'),
+    ('confirmations', 'onset_confirmed'),
+    ('rejections', 'onset_rejected_refractory'),
+)
+EVENT_TYPE_CODES = {event_type: code for code, (_, event_type) in enumerate(EVENT_CATEGORIES)}
+
+# Explicit CSV column types; stock_code stays a string to keep leading zeros.
+# Label timestamps are inferred: open intervals leave them empty (read as
+# float NaN), which a forced int64 type would reject.
+PRICE_COLUMN_TYPES = {'ts': 'int64', 'stock_code': 'string', 'price': 'float64'}
+LABEL_COLUMN_TYPES = {'stock_code': 'string'}
+
+
+def _read_csv(csv_path: Path, column_types: Dict[str, str]) -> pd.DataFrame:
+    """
+    Read CSV with the pyarrow parser when available, else pandas.
+    
+    Args:
+        csv_path: Path to CSV file.
+        column_types: Column name -> type name ('int64', 'float64', 'string');
+            columns absent from the file are ignored.
+    
+    Returns:
+        pd.DataFrame: Parsed data with numpy-backed columns.
+    """
+    if PYARROW_AVAILABLE:
+        table = pacsv.read_csv(
+            csv_path,
+            convert_options=pacsv.ConvertOptions(column_types=column_types)
+        )
+        return table.to_pandas()
+    
+    dtypes = {col: str if col_type == 'string' else col_type for col, col_type in column_types.items()}
+    return pd.read_csv(csv_path, dtype=dtypes)
+
+
+if SIMDJSON_AVAILABLE:
+    # One parser reused for every line; it recycles its internal buffers
+    _simdjson_parser = simdjson.Parser()
+    
+    def _json_loads(data: bytes) -> Any:
+        """Parse one JSON document with simdjson into plain Python objects."""
+        doc = _simdjson_parser.parse(data)
+        if isinstance(doc, simdjson.Object):
+            return doc.as_dict()
+        if isinstance(doc, simdjson.Array):
+            return doc.as_list()
+        return doc
+elif ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+else:
+    _json_loads = json.loads
+
+
+def _ms_to_datetime64(ts: pd.Series) -> np.ndarray:
+    """
+    Convert an epoch-millisecond column to datetime64[ns].
+    
+    Args:
+        ts: Epoch milliseconds.
+    
+    Returns:
+        np.ndarray: datetime64[ns] values; missing timestamps become NaT.
+    """
+    values = ts.to_numpy()
+    if values.dtype.kind in 'iu':
+        # Contiguous native int64 first so the view is a plain reinterpretation
+        ts_i64 = np.ascontiguousarray(values, dtype=np.int64)
+        return ts_i64.view('datetime64[ms]').astype('datetime64[ns]')
+    
+    # Float (NaN for missing) or nullable columns: casting NaN to int64 is
+    # platform-defined, so let pandas map missing values to NaT
+    return pd.to_datetime(ts, unit='ms').to_numpy()
+
+
+def _downsample_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with Largest-Triangle-Three-Buckets downsampling.
+    
+    Args:
+        x: Monotonic x values as float64.
+        y: y values as float64.
+        n_out: Target number of points.
+    
+    Returns:
+        np.ndarray: Sorted indices of kept points (first and last always kept).
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # n_out - 2 buckets over the interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick
+        # and the next bucket's average
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return selected
+
+
+def _nearest_prices(ts: np.ndarray, prices: np.ndarray, query_ts: np.ndarray) -> np.ndarray:
+    """
+    Look up the price at the nearest timestamp for each query.
+    
+    Args:
+        ts: Sorted (non-decreasing) price timestamps.
+        prices: Prices aligned with ts.
+        query_ts: Timestamps to look up.
+    
+    Returns:
+        np.ndarray: Price of the closest point per query; ties go to the earlier point.
+    """
+    if len(ts) == 0:
+        return np.zeros(len(query_ts), dtype=np.float64)
+    
+    query_ts = np.asarray(query_ts, dtype=np.float64)
+    right = np.clip(np.searchsorted(ts, query_ts), 0, len(ts) - 1)
+    left = np.clip(right - 1, 0, len(ts) - 1)
+    # First index of the left neighbour's run, matching idxmin on duplicated ts
+    left = np.searchsorted(ts, ts[left])
+    use_left = np.abs(query_ts - ts[left]) <= np.abs(ts[right] - query_ts)
+    return prices[np.where(use_left, left, right)].astype(np.float64)
+
 
 class PlotReporter:
     """
@@ -33,6 +196,9 @@ class PlotReporter:
         self.path_manager = PathManager(self.config)
         self.event_store = EventStore()
         
+        # Price CSV path -> (mtime, price data, per-stock groups)
+        self._price_cache: Dict[str, Tuple[float, pd.DataFrame, Dict[str, pd.DataFrame]]] = {}
+        
         # Set up matplotlib style
         plt.style.use('default')
         self.setup_plot_style()
@@ -51,36 +217,99 @@ class PlotReporter:
             'grid.alpha': 0.3
         })
     
-    def load_price_data(self, csv_path: Union[str, Path]) -> pd.DataFrame:
+    def load_price_data(
+        self, csv_path: Union[str, Path], use_parquet_cache: bool = True
+    ) -> pd.DataFrame:
         """
         Load price data from CSV file.
         
+        With pyarrow installed, the ts, stock_code and price columns are
+        written to a '<csv name>.parquet' sidecar (e.g. 'prices.csv.parquet')
+        after the first successful parse. While the sidecar is at least as new
+        as the CSV and holds those columns, it is read instead of the CSV and
+        only those columns are returned.
+        
         Args:
             csv_path: Path to CSV file with price data.
+            use_parquet_cache: Whether to read/write the .parquet sidecar.
         
         Returns:
-            pd.DataFrame: Price data with timestamp index.
+            pd.DataFrame: Price data. Datetimes for plotting are derived from
+            'ts' when needed rather than stored as a column.
         """
         csv_path = Path(csv_path)
         if not csv_path.exists():
             raise FileNotFoundError(f"Price data file not found: {csv_path}")
         
-        df = pd.read_csv(csv_path)
-        
-        # Convert timestamp to datetime for plotting
-        if 'ts' in df.columns:
-            df['datetime'] = pd.to_datetime(df['ts'], unit='ms')
-        else:
+        required_cols = list(PRICE_COLUMN_TYPES)
+        use_parquet_cache = use_parquet_cache and PYARROW_AVAILABLE
+        parquet_path = csv_path.with_name(csv_path.name + '.parquet')
+        if (use_parquet_cache and parquet_path.exists()
+                and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime):
+            try:
+                df = pd.read_parquet(parquet_path, columns=required_cols)
+                if list(df.columns) == required_cols:
+                    return df
+            except (OSError, ValueError):
+                pass  # Unreadable or mismatched cache; reparse the CSV and rewrite it
+        
+        df = _read_csv(csv_path, PRICE_COLUMN_TYPES)
+        
+        if 'ts' not in df.columns:
             raise ValueError("Price data must contain 'ts' column")
         
         # Ensure required columns exist
-        required_cols = ['ts', 'stock_code', 'price']
         missing_cols = [col for col in required_cols if col not in df.columns]
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
         
+        # Tick data is normally already in time order; sort only if it is not
+        if not df['ts'].is_monotonic_increasing:
+            df = df.sort_values('ts', kind='mergesort').reset_index(drop=True)
+        
+        if use_parquet_cache:
+            try:
+                df[required_cols].to_parquet(
+                    parquet_path, compression='zstd', row_group_size=100_000, index=False
+                )
+            except (OSError, ValueError):
+                pass  # Cache is best-effort (e.g. read-only data directory)
+        
         return df
     
+    def load_price_groups(
+        self, csv_path: Union[str, Path]
+    ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Load price data together with a per-stock split, memoized per file.
+        
+        The cache entry is reused while the CSV's modification time is unchanged,
+        so batch runs over many stocks parse and group the file only once.
+        
+        Args:
+            csv_path: Path to CSV file with price data.
+        
+        Returns:
+            Tuple of (price data, dict of stock_code -> price rows for that stock).
+        """
+        csv_path = Path(csv_path)
+        if not csv_path.exists():
+            raise FileNotFoundError(f"Price data file not found: {csv_path}")
+        
+        key = str(csv_path.resolve())
+        mtime = csv_path.stat().st_mtime
+        cached = self._price_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+        
+        price_data = self.load_price_data(csv_path)
+        groups = {
+            str(code): group
+            for code, group in price_data.groupby(price_data['stock_code'].astype(str), sort=False)
+        }
+        self._price_cache[key] = (mtime, price_data, groups)
+        return price_data, groups
+    
     def load_events_from_files(self, event_files: List[Union[str, Path]]) -> List[Dict[str, Any]]:
         """
         Load events from JSONL files.
@@ -98,18 +327,38 @@ class PlotReporter:
             if not file_path.exists():
                 continue
                 
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'rb') as f:
                 for line in f:
                     line = line.strip()
                     if line:
                         try:
-                            event = json.loads(line)
-                            # Add datetime for plotting
-                            if 'ts' in event:
-                                event['datetime'] = pd.to_datetime(event['ts'], unit='ms')
-                            all_events.append(event)
-                        except json.JSONDecodeError:
-                            continue  # Skip malformed lines
+                            all_events.append(_json_loads(line))
+                        except ValueError:
+                            continue  # Skip malformed lines (all parsers raise ValueError subclasses)
+        
+        # Add datetime for plotting, converting each distinct numeric ts only once
+        numeric_events = []
+        other_events = []
+        for event in all_events:
+            if 'ts' in event:
+                ts = event['ts']
+                if isinstance(ts, (int, float)) and not isinstance(ts, bool):
+                    numeric_events.append(event)
+                else:
+                    other_events.append(event)
+        
+        if numeric_events:
+            unique_ts, inverse = np.unique(
+                np.array([event['ts'] for event in numeric_events]), return_inverse=True
+            )
+            datetimes = pd.to_datetime(unique_ts, unit='ms')
+            for event, i in zip(numeric_events, inverse):
+                event['datetime'] = datetimes[i]
+        
+        # Null or string ts values cannot be sorted with numbers; convert them
+        # one by one (a null ts gets a None datetime)
+        for event in other_events:
+            event['datetime'] = pd.to_datetime(event['ts'], unit='ms')
         
         return all_events
     
@@ -128,74 +377,116 @@ class PlotReporter:
             return None
         
         try:
-            df = pd.read_csv(labels_path)
+            df = _read_csv(labels_path, LABEL_COLUMN_TYPES)
             
             # Convert timestamps to datetime
             if 'timestamp_start' in df.columns and 'timestamp_end' in df.columns:
-                df['datetime_start'] = pd.to_datetime(df['timestamp_start'], unit='ms')
-                df['datetime_end'] = pd.to_datetime(df['timestamp_end'], unit='ms')
+                df['datetime_start'] = _ms_to_datetime64(df['timestamp_start'])
+                df['datetime_end'] = _ms_to_datetime64(df['timestamp_end'])
             
             return df
         except Exception:
             return None
     
+    def events_to_frame(self, events: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Project events into a typed DataFrame for vectorized filtering and plotting.
+        
+        Args:
+            events: Events as returned by load_events_from_files.
+        
+        Returns:
+            pd.DataFrame: One row per event with a non-null 'ts', with columns ts
+            (int64), stock_code (category), event_type (category) and datetime
+            (datetime64[ns]).
+        """
+        timed_events = [event for event in events if event.get('ts') is not None]
+        frame = pd.DataFrame({
+            'ts': np.fromiter(
+                (event['ts'] for event in timed_events), dtype=np.int64, count=len(timed_events)
+            ),
+            'stock_code': pd.Categorical(
+                [str(event.get('stock_code', '')) for event in timed_events]
+            ),
+            'event_type': pd.Categorical(
+                [event.get('event_type', '') for event in timed_events]
+            ),
+        })
+        frame['datetime'] = _ms_to_datetime64(frame['ts'])
+        return frame
+    
     def filter_events_by_stock_and_timerange(
         self,
-        events: List[Dict[str, Any]],
+        events: Union[List[Dict[str, Any]], pd.DataFrame],
         stock_code: str,
         start_time: pd.Timestamp,
         end_time: pd.Timestamp
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    ) -> Dict[str, Any]:
         """
         Filter events by stock code and time range, categorized by type.
         
         Args:
-            events: List of all events.
+            events: List of all events, or a frame from events_to_frame.
             stock_code: Stock code to filter by.
             start_time: Start of time range.
             end_time: End of time range.
         
         Returns:
-            Dict: Events categorized by type (candidates, confirmations, rejections).
+            Dict: Events categorized by type (candidates, confirmations, rejections),
+            as lists of event dicts or as DataFrames matching the input form.
         """
-        filtered_events = {
-            'candidates': [],
-            'confirmations': [],
-            'rejections': []
+        stock_code = str(stock_code)
+        
+        # Inclusive bounds in ms (ceil/floor keep sub-ms bounds exact)
+        start_ms = -(-pd.Timestamp(start_time).value // 1_000_000)
+        end_ms = pd.Timestamp(end_time).value // 1_000_000
+        
+        if isinstance(events, pd.DataFrame):
+            mask = (
+                (events['stock_code'] == stock_code)
+                & (events['ts'] >= start_ms)
+                & (events['ts'] <= end_ms)
+            )
+            return {
+                category: events[mask & (events['event_type'] == event_type)]
+                for category, event_type in EVENT_CATEGORIES
+            }
+        
+        filtered_events: Dict[str, List[Dict[str, Any]]] = {
+            category: [] for category, _ in EVENT_CATEGORIES
         }
         
-        for event in events:
-            # Filter by stock code
-            event_stock = str(event.get('stock_code', ''))
-            if event_stock != str(stock_code):
-                continue
-            
-            # Filter by time range
-            if 'datetime' not in event:
-                continue
-            
-            event_time = event['datetime']
-            if not (start_time <= event_time <= end_time):
-                continue
-            
-            # Categorize by event type
-            event_type = event.get('event_type', '')
-            if event_type == 'onset_candidate':
-                filtered_events['candidates'].append(event)
-            elif event_type == 'onset_confirmed':
-                filtered_events['confirmations'].append(event)
-            elif event_type == 'onset_rejected_refractory':
-                filtered_events['rejections'].append(event)
+        # Bucket by stock code; events without a timestamp cannot be placed
+        bucket = [
+            event for event in events
+            if 'datetime' in event and str(event.get('stock_code', '')) == stock_code
+        ]
+        if not bucket:
+            return filtered_events
+        
+        # Parallel arrays over the bucket: epoch ms and int8 event type codes
+        ts_ms = np.fromiter((event['ts'] for event in bucket), dtype=np.int64, count=len(bucket))
+        type_codes = np.fromiter(
+            (EVENT_TYPE_CODES.get(event.get('event_type'), -1) for event in bucket),
+            dtype=np.int8, count=len(bucket)
+        )
+        
+        in_range = (ts_ms >= start_ms) & (ts_ms <= end_ms)
+        
+        for code, (category, _) in enumerate(EVENT_CATEGORIES):
+            idx = np.nonzero(in_range & (type_codes == code))[0]
+            filtered_events[category] = [bucket[i] for i in idx]
         
         return filtered_events
     
     def create_plot(
         self,
         price_data: pd.DataFrame,
-        events: Dict[str, List[Dict[str, Any]]],
+        events: Dict[str, Any],
         labels_data: Optional[pd.DataFrame] = None,
         stock_code: Optional[str] = None,
-        title_suffix: str = ""
+        title_suffix: str = "",
+        fig: Optional[plt.Figure] = None
     ) -> Tuple[plt.Figure, plt.Axes]:
         """
         Create the main plot with price data and events.
@@ -206,12 +497,17 @@ class PlotReporter:
             labels_data: Optional labels DataFrame.
             stock_code: Stock code for filtering.
             title_suffix: Additional title text.
+            fig: Figure to draw into (cleared first). If None, a new one is created.
         
         Returns:
             Tuple of (figure, axes) objects.
         """
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(14, 8))
+        # Create figure and axis, or reuse a caller-owned figure
+        if fig is None:
+            fig, ax = plt.subplots(figsize=(14, 8))
+        else:
+            fig.clear()
+            ax = fig.add_subplot(111)
         
         # Filter price data by stock if specified
         if stock_code:
@@ -222,9 +518,20 @@ class PlotReporter:
                    transform=ax.transAxes, ha='center', va='center', fontsize=14)
             return fig, ax
         
-        # Plot price line
-        ax.plot(price_data['datetime'], price_data['price'], 
-               color='black', linewidth=1.5, label='Price', alpha=0.8)
+        # Plot price line, downsampled to roughly one point per pixel column
+        line_data = price_data
+        visual = self.config.visual
+        if visual.downsample and len(price_data) > visual.downsample_min_points:
+            n_out = int(fig.get_size_inches()[0] * fig.dpi)
+            x = price_data['ts'].to_numpy(dtype=np.float64)
+            y = price_data['price'].to_numpy(dtype=np.float64)
+            line_data = price_data.iloc[_downsample_lttb(x, y, n_out)]
+        
+        # Dense layers are rasterized in vector outputs (PDF/SVG); event markers
+        # (zorder >= 4) stay vector
+        ax.set_rasterization_zorder(1)
+        ax.plot(_ms_to_datetime64(line_data['ts']), line_data['price'].to_numpy(), 
+               color='black', linewidth=1.5, label='Price', alpha=0.8, rasterized=True)
         
         # Add label spans (background)
         if labels_data is not None and not labels_data.empty:
@@ -232,9 +539,14 @@ class PlotReporter:
             if stock_code:
                 labels_data = labels_data[labels_data['stock_code'].astype(str) == str(stock_code)]
             
-            for _, label in labels_data.iterrows():
-                ax.axvspan(label['datetime_start'], label['datetime_end'], 
-                          alpha=0.2, color='blue', label='Label Span' if _ == 0 else "")
+            if not labels_data.empty:
+                # One collection for all spans: x in data units, y spans the full axes
+                starts = mdates.date2num(labels_data['datetime_start'].to_numpy())
+                ends = mdates.date2num(labels_data['datetime_end'].to_numpy())
+                verts = [[(s, 0), (s, 1), (e, 1), (e, 0)] for s, e in zip(starts, ends)]
+                spans = PolyCollection(verts, transform=ax.get_xaxis_transform(),
+                                       alpha=0.2, facecolor='blue', label='Label Span', zorder=0)
+                ax.add_collection(spans, autolim=False)
         
         # Plot events
         self.plot_events(ax, events, price_data)
@@ -244,47 +556,50 @@ class PlotReporter:
         
         return fig, ax
     
-    def plot_events(self, ax: plt.Axes, events: Dict[str, List[Dict[str, Any]]], price_data: pd.DataFrame):
+    def plot_events(self, ax: plt.Axes, events: Dict[str, Any], price_data: pd.DataFrame):
         """
         Plot event markers on the chart.
         
         Args:
             ax: Matplotlib axes object.
-            events: Categorized events dict.
+            events: Categorized events dict (lists of event dicts or DataFrames).
             price_data: Price data for getting price levels at event times.
         """
-        # Get price interpolation function for event positioning
-        def get_price_at_time(timestamp):
-            """Get price at specific timestamp by interpolation."""
-            if price_data.empty:
-                return 0
-            
-            # Find closest price point
-            time_diffs = np.abs(price_data['ts'] - timestamp)
-            closest_idx = time_diffs.idxmin()
-            return price_data.loc[closest_idx, 'price']
+        # Sorted ts/price arrays for binary-search price lookup at event times
+        if not price_data['ts'].is_monotonic_increasing:
+            price_data = price_data.sort_values('ts', kind='mergesort')
+        price_ts = price_data['ts'].to_numpy(dtype=np.float64)
+        price_values = price_data['price'].to_numpy()
+        
+        def event_xy(category_events):
+            """Build scatter x (matplotlib date numbers) and y arrays."""
+            if isinstance(category_events, pd.DataFrame):
+                times = category_events['datetime'].to_numpy()
+                event_ts = category_events['ts'].to_numpy()
+            else:
+                times = np.array([event['datetime'] for event in category_events], dtype='datetime64[ns]')
+                event_ts = [event['ts'] for event in category_events]
+            prices = _nearest_prices(price_ts, price_values, event_ts)
+            return mdates.date2num(times), prices
         
         # Plot candidates (orange triangles)
-        if events['candidates']:
-            times = [event['datetime'] for event in events['candidates']]
-            prices = [get_price_at_time(event['ts']) for event in events['candidates']]
-            ax.scatter(times, prices, marker='^', color='orange', s=80, 
+        if len(events['candidates']):
+            x, y = event_xy(events['candidates'])
+            ax.scatter(x, y, marker='^', color='orange', s=80, 
                       label=f'Candidates ({len(events["candidates"])})', 
                       alpha=0.8, edgecolors='black', linewidth=0.5, zorder=5)
         
         # Plot confirmations (red circles)
-        if events['confirmations']:
-            times = [event['datetime'] for event in events['confirmations']]
-            prices = [get_price_at_time(event['ts']) for event in events['confirmations']]
-            ax.scatter(times, prices, marker='o', color='red', s=100, 
+        if len(events['confirmations']):
+            x, y = event_xy(events['confirmations'])
+            ax.scatter(x, y, marker='o', color='red', s=100, 
                       label=f'Confirmations ({len(events["confirmations"])})', 
                       alpha=0.9, edgecolors='darkred', linewidth=1, zorder=6)
         
         # Plot rejections (gray X marks)
-        if events['rejections']:
-            times = [event['datetime'] for event in events['rejections']]
-            prices = [get_price_at_time(event['ts']) for event in events['rejections']]
-            ax.scatter(times, prices, marker='x', color='gray', s=60, 
+        if len(events['rejections']):
+            x, y = event_xy(events['rejections'])
+            ax.scatter(x, y, marker='x', color='gray', s=60, 
                       label=f'Rejections ({len(events["rejections"])})', 
                       alpha=0.7, linewidth=2, zorder=4)
     
@@ -322,9 +637,15 @@ class PlotReporter:
         ax.legend(loc='upper left', framealpha=0.9)
         
         # Tight layout
-        plt.tight_layout()
+        ax.figure.tight_layout()
     
-    def save_plot(self, fig: plt.Figure, output_path: Union[str, Path], dpi: int = 300) -> bool:
+    def save_plot(
+        self,
+        fig: plt.Figure,
+        output_path: Union[str, Path],
+        dpi: int = 150,
+        close: bool = True
+    ) -> bool:
         """
         Save plot to file.
         
@@ -332,6 +653,8 @@ class PlotReporter:
             fig: Matplotlib figure object.
             output_path: Path to save the plot.
             dpi: Resolution for PNG output.
+            close: Whether to close the figure afterwards. Pass False when the
+                figure is reused for further reports.
         
         Returns:
             bool: True if saved successfully.
@@ -342,14 +665,19 @@ class PlotReporter:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            fig.savefig(output_path, dpi=dpi, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none')
+            # Layout is already tight (format_plot); use a fast zlib level for PNG
+            save_kwargs = {}
+            if output_path.suffix.lower() == '.png':
+                save_kwargs['pil_kwargs'] = {'compress_level': 1, 'optimize': False}
+            fig.savefig(output_path, dpi=dpi, facecolor='white', edgecolor='none',
+                       **save_kwargs)
             return True
         except Exception as e:
             print(f"Error saving plot: {e}")
             return False
         finally:
-            plt.close(fig)
+            if close:
+                plt.close(fig)
     
     def generate_report(
         self,
@@ -358,7 +686,8 @@ class PlotReporter:
         output_path: Union[str, Path],
         labels_path: Optional[Union[str, Path]] = None,
         stock_code: Optional[str] = None,
-        title_suffix: str = ""
+        title_suffix: str = "",
+        fig: Optional[plt.Figure] = None
     ) -> Dict[str, Any]:
         """
         Generate complete visual report.
@@ -370,14 +699,17 @@ class PlotReporter:
             labels_path: Optional path to labels CSV.
             stock_code: Optional stock code filter.
             title_suffix: Additional title text.
+            fig: Optional figure reused across reports (left open for the caller).
         
         Returns:
-            Dict: Report generation summary.
+            Dict: Report generation summary. 'skipped' is True when there was no
+            price data and no events in range; no plot is drawn or saved then
+            and 'save_success' is False.
         """
         try:
             # Load data
-            price_data = self.load_price_data(csv_path)
-            events_list = self.load_events_from_files(event_files)
+            price_data, price_groups = self.load_price_groups(csv_path)
+            event_frame = self.events_to_frame(self.load_events_from_files(event_files))
             labels_data = self.load_labels_data(labels_path) if labels_path else None
             
             # Determine stock code and time range
@@ -389,28 +721,37 @@ class PlotReporter:
             
             # Filter data by time range
             if not price_data.empty:
-                start_time = price_data['datetime'].min()
-                end_time = price_data['datetime'].max()
+                start_time = pd.Timestamp(price_data['ts'].min(), unit='ms')
+                end_time = pd.Timestamp(price_data['ts'].max(), unit='ms')
             else:
                 # Use event time range as fallback
-                event_times = [pd.to_datetime(e['ts'], unit='ms') for e in events_list if 'ts' in e]
-                if event_times:
-                    start_time = min(event_times)
-                    end_time = max(event_times)
+                if not event_frame.empty:
+                    start_time = event_frame['datetime'].min()
+                    end_time = event_frame['datetime'].max()
                 else:
                     start_time = pd.Timestamp.now()
                     end_time = pd.Timestamp.now()
             
             # Filter events
             filtered_events = self.filter_events_by_stock_and_timerange(
-                events_list, stock_code, start_time, end_time
+                event_frame, stock_code, start_time, end_time
             )
             
-            # Create plot
-            fig, ax = self.create_plot(price_data, filtered_events, labels_data, stock_code, title_suffix)
+            # Nothing to draw: skip matplotlib entirely
+            skipped = price_data.empty and not any(len(v) for v in filtered_events.values())
             
-            # Save plot
-            save_success = self.save_plot(fig, output_path)
+            if skipped:
+                save_success = False
+            else:
+                # Create plot
+                owns_fig = fig is None
+                stock_price_data = price_groups.get(str(stock_code), price_data.iloc[:0])
+                fig, ax = self.create_plot(
+                    stock_price_data, filtered_events, labels_data, stock_code, title_suffix, fig=fig
+                )
+                
+                # Save plot
+                save_success = self.save_plot(fig, output_path, close=owns_fig)
             
             # Generate summary
             summary = {
@@ -427,7 +768,8 @@ class PlotReporter:
                 },
                 "labels_count": len(labels_data) if labels_data is not None else 0,
                 "output_path": str(Path(output_path).absolute()),
-                "save_success": save_success
+                "save_success": save_success,
+                "skipped": skipped
             }
             
             return summary
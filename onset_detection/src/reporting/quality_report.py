@@ -1,8 +1,13 @@
 """Quality reporting for onset detection events."""
 
+import itertools
 import json
+import os
+import sys
 import numpy as np
-import pandas as pd
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 
@@ -10,6 +15,27 @@ from ..config_loader import Config, load_config
 from ..event_store import EventStore
 from ..utils.paths import PathManager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow.compute as pc
+    import pyarrow.json as pajson
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# orjson parses bytes directly; stdlib json accepts bytes too
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Interned so that equal strings from the parser hit the identity fast path
+EVENT_CANDIDATE = sys.intern('onset_candidate')
+EVENT_CONFIRMED = sys.intern('onset_confirmed')
+EVENT_REJECTED = sys.intern('onset_rejected_refractory')
+
 
 class QualityReporter:
     """
@@ -19,6 +45,21 @@ class QualityReporter:
     comprehensive quality metrics and performance statistics.
     """
     
+    # Above this many events, categorize with pandas instead of a Python loop
+    FRAME_ANALYSIS_MIN_EVENTS = 5000
+    
+    # Above this many bytes of JSONL, parse files straight into Arrow tables
+    ARROW_ANALYSIS_MIN_BYTES = 32 << 20
+    
+    # Event files read from the EventStore directory when none are given
+    DEFAULT_EVENT_FILES = (
+        "events.jsonl",
+        "sample.jsonl",
+        "sample_candidates.jsonl",
+        "sample_confirms.jsonl",
+        "sample_refractory.jsonl"
+    )
+    
     def __init__(self, config: Optional[Config] = None):
         """
         Initialize quality reporter.
@@ -29,35 +70,223 @@ class QualityReporter:
         self.config = config or load_config()
         self.path_manager = PathManager(self.config)
         self.event_store = EventStore()
+        self.reset_incremental()
+        
+        # Config values echoed in every report, resolved once
+        self._cfg_summary = {
+            "refractory_duration_s": self.config.refractory.duration_s,
+            "confirm_window_s": self.config.confirm.window_s,
+            "detection_threshold": self.config.detection.score_threshold
+        }
+    
+    def _parse_one_file(self, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """
+        Parse a single JSONL event file.
+        
+        Args:
+            file_path: Path to JSONL event file.
+        
+        Returns:
+            List[Dict]: Events from the file (empty if the file is missing).
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            return []
+        
+        events = []
+        with open(file_path, 'rb', buffering=1 << 20) as f:
+            for line in f:
+                # Both parsers accept surrounding whitespace; blank and
+                # malformed lines raise a ValueError subclass and are skipped
+                try:
+                    events.append(_json_loads(line))
+                except ValueError:
+                    continue
+        
+        return events
     
     def load_events_from_files(self, event_files: List[Union[str, Path]]) -> List[Dict[str, Any]]:
         """
         Load events from multiple JSONL files.
         
+        Files are parsed concurrently; results keep the input file order.
+        
         Args:
             event_files: List of paths to JSONL event files.
         
         Returns:
             List[Dict]: Combined list of events from all files.
         """
-        all_events = []
+        event_files = list(event_files)
+        if len(event_files) <= 1:
+            results = [self._parse_one_file(f) for f in event_files]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(event_files))) as executor:
+                results = list(executor.map(self._parse_one_file, event_files))
         
-        for file_path in event_files:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                continue
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            event = json.loads(line)
-                            all_events.append(event)
-                        except json.JSONDecodeError:
-                            continue  # Skip malformed lines
-        
-        return all_events
+        return list(itertools.chain.from_iterable(results))
+    
+    def _categorize_events(
+        self,
+        events: List[Dict[str, Any]],
+        stock_codes: Optional[set] = None
+    ) -> tuple:
+        """
+        Categorize events in a single Python pass.
+        
+        Args:
+            events: List of events.
+            stock_codes: Set to accumulate unique stock codes into, if given.
+        
+        Returns:
+            tuple: (event type counts, confirmation ts list,
+                confirmed_from list, number of unique stocks).
+        """
+        event_types = {}
+        confirmed_at = []
+        confirmed_from = []
+        raw_stocks = []
+        
+        # Bind hot methods once instead of resolving them per event
+        count_get = event_types.get
+        add_at = confirmed_at.append
+        add_from = confirmed_from.append
+        add_stock = raw_stocks.append
+        
+        # Null fields count as missing, as in the frame and arrow paths
+        for event in events:
+            event_type = event.get('event_type')
+            if event_type is None:
+                event_type = 'unknown'
+            event_types[event_type] = count_get(event_type, 0) + 1
+            
+            if event_type == EVENT_CONFIRMED:
+                ts = event.get('ts')
+                from_ts = event.get('confirmed_from')
+                if ts is not None and from_ts is not None:
+                    add_at(ts)
+                    add_from(from_ts)
+            
+            stock_code = event.get('stock_code')
+            if stock_code is not None:
+                add_stock(stock_code)
+        
+        # Dedupe the raw codes first (parsed str objects already cache their
+        # hash), then stringify only the distinct values
+        unique_stocks = {str(code) for code in set(raw_stocks)}
+        if stock_codes is not None:
+            stock_codes.update(unique_stocks)
+            return event_types, confirmed_at, confirmed_from, len(stock_codes)
+        
+        return event_types, confirmed_at, confirmed_from, len(unique_stocks)
+    
+    def _categorize_events_frame(self, events: List[Dict[str, Any]]) -> tuple:
+        """
+        Categorize a large event batch with columnar pandas operations.
+        
+        Args:
+            events: List of events.
+        
+        Returns:
+            tuple: Same layout as _categorize_events, with ndarrays for the
+                confirmation timestamps.
+        """
+        import pandas as pd  # Deferred: only large batches need it
+        
+        df = pd.DataFrame(events)
+        n = len(df)
+        
+        def column(name: str) -> "pd.Series":
+            return df[name] if name in df.columns else pd.Series([np.nan] * n, index=df.index)
+        
+        # Encode event types to small int codes once; everything below is array ops
+        type_codes, type_names = pd.factorize(column('event_type').fillna('unknown'))
+        type_counts = np.bincount(type_codes, minlength=len(type_names))
+        event_types = {name: int(count) for name, count in zip(type_names, type_counts)}
+        
+        ts = column('ts')
+        from_ts = column('confirmed_from')
+        mask = ts.notna().to_numpy() & from_ts.notna().to_numpy()
+        if EVENT_CONFIRMED in event_types:
+            mask &= type_codes == type_names.get_loc(EVENT_CONFIRMED)
+        else:
+            mask[:] = False
+        confirmed_at = ts.to_numpy()[mask].astype(np.int64)
+        confirmed_from = from_ts.to_numpy()[mask].astype(np.int64)
+        
+        n_stocks = int(column('stock_code').dropna().astype(str).nunique())
+        
+        return event_types, confirmed_at, confirmed_from, n_stocks
+    
+    def _analyze_files_arrow(self, event_files: List[Union[str, Path]]) -> Optional[Dict[str, Any]]:
+        """
+        Analyze large JSONL files with pyarrow's columnar JSON reader.
+        
+        Skips Python dict construction entirely. Each file is reduced on its
+        own and the partial results merged, so files with differing column
+        types don't need a common schema.
+        
+        Args:
+            event_files: List of paths to JSONL event files.
+        
+        Returns:
+            Optional[Dict]: Quality report, or None if the input is below
+                ARROW_ANALYSIS_MIN_BYTES or a file can't be parsed as a whole
+                (the caller then falls back to line-by-line parsing, which
+                skips malformed lines).
+        """
+        paths = [Path(f) for f in event_files]
+        paths = [p for p in paths if p.exists()]
+        if sum(p.stat().st_size for p in paths) < self.ARROW_ANALYSIS_MIN_BYTES:
+            return None
+        
+        read_options = pajson.ReadOptions(block_size=8 << 20, use_threads=True)
+        total_events = 0
+        event_types = Counter()
+        confirmed_at = []
+        confirmed_from = []
+        stock_codes = set()
+        
+        for path in paths:
+            try:
+                table = pajson.read_json(path, read_options=read_options)
+            except ValueError:  # ArrowInvalid: malformed line
+                return None
+            
+            names = table.column_names
+            n = table.num_rows
+            total_events += n
+            
+            if 'event_type' in names:
+                event_type = pc.fill_null(table['event_type'].cast('string'), 'unknown')
+                for item in pc.value_counts(event_type).to_pylist():
+                    event_types[item['values']] += item['counts']
+            else:
+                event_type = None
+                event_types['unknown'] += n
+            
+            if event_type is not None and 'ts' in names and 'confirmed_from' in names:
+                mask = pc.and_(
+                    pc.equal(event_type, EVENT_CONFIRMED),
+                    pc.and_(pc.is_valid(table['ts']), pc.is_valid(table['confirmed_from']))
+                )
+                confirmed_at.append(table['ts'].filter(mask).to_numpy().astype(np.int64))
+                confirmed_from.append(table['confirmed_from'].filter(mask).to_numpy().astype(np.int64))
+            
+            if 'stock_code' in names:
+                codes = pc.unique(table['stock_code'].cast('string'))
+                stock_codes.update(c for c in codes.to_pylist() if c is not None)
+        
+        if total_events == 0:
+            return self.analyze_events([])
+        
+        return self._build_report(
+            total_events,
+            dict(event_types),
+            np.concatenate(confirmed_at) if confirmed_at else [],
+            np.concatenate(confirmed_from) if confirmed_from else [],
+            len(stock_codes)
+        )
     
     def analyze_events(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -84,54 +313,64 @@ class QualityReporter:
                 "stocks_analyzed": 0,
                 "total_events": 0,
                 "event_types": {},
-                "config_used": {
-                    "refractory_duration_s": self.config.refractory.duration_s,
-                    "confirm_window_s": self.config.confirm.window_s,
-                    "detection_threshold": self.config.detection.score_threshold
-                }
+                "config_used": dict(self._cfg_summary)
             }
         
-        # Sort events by timestamp for proper analysis
-        sorted_events = sorted(events, key=lambda x: x.get('ts', 0))
+        # Order-independent summary; do not sort. Each confirmation carries its
+        # own confirmed_from, so TTA needs no temporal ordering either.
+        if len(events) > self.FRAME_ANALYSIS_MIN_EVENTS:
+            event_types, confirmed_at, confirmed_from, n_stocks = self._categorize_events_frame(events)
+        else:
+            event_types, confirmed_at, confirmed_from, n_stocks = self._categorize_events(events)
         
-        # Count events by type
-        candidates = [e for e in sorted_events if e.get('event_type') == 'onset_candidate']
-        confirmations = [e for e in sorted_events if e.get('event_type') == 'onset_confirmed']
-        rejections = [e for e in sorted_events if e.get('event_type') == 'onset_rejected_refractory']
+        return self._build_report(len(events), event_types, confirmed_at, confirmed_from, n_stocks)
+    
+    def _build_report(
+        self,
+        total_events: int,
+        event_types: Dict[str, int],
+        confirmed_at,
+        confirmed_from,
+        n_stocks: int
+    ) -> Dict[str, Any]:
+        """
+        Build the quality report from categorized event data.
         
-        # Event type statistics
-        event_types = {}
-        for event in sorted_events:
-            event_type = event.get('event_type', 'unknown')
-            event_types[event_type] = event_types.get(event_type, 0) + 1
+        Args:
+            total_events: Number of events analyzed.
+            event_types: Event counts by type.
+            confirmed_at: Confirmation timestamps (ms).
+            confirmed_from: Candidate timestamps the confirmations came from (ms).
+            n_stocks: Number of unique stocks.
         
+        Returns:
+            Dict: Quality metrics and statistics.
+        """
         # Calculate rates
-        n_candidates = len(candidates)
-        n_confirms = len(confirmations)
-        n_rejected = len(rejections)
+        n_candidates = event_types.get(EVENT_CANDIDATE, 0)
+        n_confirms = event_types.get(EVENT_CONFIRMED, 0)
+        n_rejected = event_types.get(EVENT_REJECTED, 0)
         
         confirm_rate = n_confirms / n_candidates if n_candidates > 0 else 0.0
         rejection_rate = n_rejected / n_candidates if n_candidates > 0 else 0.0
         
-        # Calculate Time-to-Alert (TTA) statistics
-        tta_values = []
-        for confirmation in confirmations:
-            if 'confirmed_from' in confirmation and 'ts' in confirmation:
-                confirmed_from = confirmation['confirmed_from']
-                confirmed_at = confirmation['ts']
-                tta_seconds = (confirmed_at - confirmed_from) / 1000.0
-                if tta_seconds >= 0:  # Valid TTA
-                    tta_values.append(tta_seconds)
+        # Time-to-Alert (TTA) in seconds, computed on int64 arrays
+        tta_values = (
+            np.asarray(confirmed_at, dtype=np.int64) - np.asarray(confirmed_from, dtype=np.int64)
+        ).astype(np.float64) * 1e-3
+        tta_values = tta_values[tta_values >= 0]  # Valid TTA only
         
         # TTA statistics
         tta_stats = {}
-        if tta_values:
+        if tta_values.size:
+            # One partition shared by all quantiles (q0/q100 are min/max)
+            tta_min, tta_median, tta_p95, tta_max = np.percentile(tta_values, [0.0, 50.0, 95.0, 100.0])
             tta_stats = {
-                "tta_avg": float(np.mean(tta_values)),
-                "tta_median": float(np.median(tta_values)),
-                "tta_p95": float(np.percentile(tta_values, 95)),
-                "tta_min": float(np.min(tta_values)),
-                "tta_max": float(np.max(tta_values))
+                "tta_avg": float(tta_values.mean()),
+                "tta_median": float(tta_median),
+                "tta_p95": float(tta_p95),
+                "tta_min": float(tta_min),
+                "tta_max": float(tta_max)
             }
         else:
             tta_stats = {
@@ -142,12 +381,6 @@ class QualityReporter:
                 "tta_max": 0.0
             }
         
-        # Count unique stocks
-        stock_codes = set()
-        for event in sorted_events:
-            if 'stock_code' in event:
-                stock_codes.add(str(event['stock_code']))
-        
         # Compile final report
         report = {
             "n_candidates": n_candidates,
@@ -155,14 +388,10 @@ class QualityReporter:
             "n_rejected": n_rejected,
             "confirm_rate": confirm_rate,
             "rejection_rate": rejection_rate,
-            "stocks_analyzed": len(stock_codes),
-            "total_events": len(sorted_events),
+            "stocks_analyzed": n_stocks,
+            "total_events": total_events,
             "event_types": event_types,
-            "config_used": {
-                "refractory_duration_s": self.config.refractory.duration_s,
-                "confirm_window_s": self.config.confirm.window_s,
-                "detection_threshold": self.config.detection.score_threshold
-            }
+            "config_used": dict(self._cfg_summary)
         }
         
         # Add TTA statistics
@@ -170,6 +399,111 @@ class QualityReporter:
         
         return report
     
+    def _default_event_files(self) -> List[Path]:
+        """
+        Get the default event files from EventStore that exist.
+        
+        Returns:
+            List[Path]: Existing default JSONL event files.
+        """
+        events_dir = self.event_store.events_dir
+        
+        # One directory listing instead of a stat() per candidate file
+        try:
+            with os.scandir(events_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return []
+        
+        return [events_dir / name for name in self.DEFAULT_EVENT_FILES if name in present]
+    
+    def reset_incremental(self) -> None:
+        """Discard the running state used by generate_incremental_report."""
+        self._incremental = {
+            "offsets": {},
+            "total_events": 0,
+            "event_types": Counter(),
+            "confirmed_at": [],
+            "confirmed_from": [],
+            "stock_codes": set()
+        }
+    
+    def _read_new_events(self, file_path: Path, offset: int) -> tuple:
+        """
+        Parse complete JSONL lines appended to a file since offset.
+        
+        A trailing line without a newline is left for the next call.
+        
+        Args:
+            file_path: Path to JSONL event file.
+            offset: Byte offset already consumed.
+        
+        Returns:
+            tuple: (new events, new byte offset).
+        """
+        with open(file_path, 'rb', buffering=1 << 20) as f:
+            f.seek(offset)
+            data = f.read()
+        
+        end = data.rfind(b'\n') + 1
+        events = []
+        for line in data[:end].splitlines():
+            try:
+                events.append(_json_loads(line))
+            except ValueError:
+                continue  # Skip blank/malformed lines
+        
+        return events, offset + end
+    
+    def generate_incremental_report(
+        self,
+        event_files: Optional[List[Union[str, Path]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate quality report, parsing only events appended since the last call.
+        
+        Counts, stock set and TTA inputs are kept on the reporter, so each call
+        costs O(new events). If a file shrinks (rotated or truncated), the
+        running state is reset and all files are re-read.
+        
+        Args:
+            event_files: List of paths to JSONL event files. If None, uses the
+                default EventStore files.
+        
+        Returns:
+            Dict: Quality report over all events seen so far.
+        """
+        if event_files is None:
+            event_files = self._default_event_files()
+        event_files = [Path(f) for f in event_files]
+        
+        state = self._incremental
+        sizes = {f: f.stat().st_size for f in event_files if f.exists()}
+        if any(size < state["offsets"].get(f, 0) for f, size in sizes.items()):
+            self.reset_incremental()
+            state = self._incremental
+        
+        for file_path, size in sizes.items():
+            offset = state["offsets"].get(file_path, 0)
+            if size == offset:
+                continue
+            
+            new_events, state["offsets"][file_path] = self._read_new_events(file_path, offset)
+            new_types, new_at, new_from, _ = self._categorize_events(new_events, state["stock_codes"])
+            
+            state["total_events"] += len(new_events)
+            state["event_types"].update(new_types)
+            state["confirmed_at"].extend(new_at)
+            state["confirmed_from"].extend(new_from)
+        
+        return self._build_report(
+            state["total_events"],
+            dict(state["event_types"]),
+            state["confirmed_at"],
+            state["confirmed_from"],
+            len(state["stock_codes"])
+        )
+    
     def generate_report(
         self, 
         event_files: Optional[List[Union[str, Path]]] = None,
@@ -187,16 +521,12 @@ class QualityReporter:
         """
         if events is None:
             if event_files is None:
-                # Use default event files from EventStore
-                events_dir = self.event_store.events_dir
-                default_files = [
-                    events_dir / "events.jsonl",
-                    events_dir / "sample.jsonl",
-                    events_dir / "sample_candidates.jsonl",
-                    events_dir / "sample_confirms.jsonl",
-                    events_dir / "sample_refractory.jsonl"
-                ]
-                event_files = [f for f in default_files if f.exists()]
+                event_files = self._default_event_files()
+            
+            if PYARROW_AVAILABLE:
+                report = self._analyze_files_arrow(event_files)
+                if report is not None:
+                    return report
             
             events = self.load_events_from_files(event_files)
         
@@ -218,12 +548,23 @@ class QualityReporter:
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Write to a temp file and swap it in so readers never see a partial report
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        report,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, output_path)
             return True
         except Exception as e:
             print(f"Error saving report: {e}")
+            tmp_path.unlink(missing_ok=True)
             return False
     
     def generate_and_save_report(
@@ -248,57 +589,80 @@ class QualityReporter:
         
         # Add metadata about the operation
         report["_metadata"] = {
-            "generated_at": pd.Timestamp.now().isoformat(),
+            "generated_at": datetime.now().isoformat(),
             "output_path": str(Path(output_path).absolute()),
             "save_success": save_success
         }
         
         return report
     
-    def print_summary(self, report: Dict[str, Any]) -> None:
+    def format_summary(self, report: Dict[str, Any]) -> str:
         """
-        Print a human-readable summary of the quality report.
+        Format a human-readable summary of the quality report.
         
         Args:
             report: Quality report dictionary.
-        """
-        print("\n" + "="*50)
-        print("ONSET DETECTION QUALITY REPORT")
-        print("="*50)
-        
-        print(f"Total Events Analyzed: {report['total_events']}")
-        print(f"Stocks Analyzed: {report['stocks_analyzed']}")
-        
-        print(f"\nEvent Breakdown:")
-        print(f"  Candidates: {report['n_candidates']}")
-        print(f"  Confirmations: {report['n_confirms']}")
-        print(f"  Rejections (Refractory): {report['n_rejected']}")
         
-        print(f"\nPerformance Metrics:")
-        print(f"  Confirmation Rate: {report['confirm_rate']:.2%}")
-        print(f"  Rejection Rate: {report['rejection_rate']:.2%}")
+        Returns:
+            str: Summary text, newline terminated.
+        """
+        lines = [
+            "",
+            "=" * 50,
+            "ONSET DETECTION QUALITY REPORT",
+            "=" * 50,
+            f"Total Events Analyzed: {report['total_events']}",
+            f"Stocks Analyzed: {report['stocks_analyzed']}",
+            "",
+            "Event Breakdown:",
+            f"  Candidates: {report['n_candidates']}",
+            f"  Confirmations: {report['n_confirms']}",
+            f"  Rejections (Refractory): {report['n_rejected']}",
+            "",
+            "Performance Metrics:",
+            f"  Confirmation Rate: {report['confirm_rate']:.2%}",
+            f"  Rejection Rate: {report['rejection_rate']:.2%}",
+        ]
         
         if report['n_confirms'] > 0:
-            print(f"\nTime-to-Alert (TTA) Statistics:")
-            print(f"  Average TTA: {report['tta_avg']:.2f}s")
-            print(f"  Median TTA: {report['tta_median']:.2f}s")
-            print(f"  95th Percentile TTA: {report['tta_p95']:.2f}s")
-            print(f"  TTA Range: {report['tta_min']:.2f}s - {report['tta_max']:.2f}s")
+            lines += [
+                "",
+                "Time-to-Alert (TTA) Statistics:",
+                f"  Average TTA: {report['tta_avg']:.2f}s",
+                f"  Median TTA: {report['tta_median']:.2f}s",
+                f"  95th Percentile TTA: {report['tta_p95']:.2f}s",
+                f"  TTA Range: {report['tta_min']:.2f}s - {report['tta_max']:.2f}s",
+            ]
         else:
-            print(f"\nNo confirmations found - TTA statistics not available")
+            lines += ["", "No confirmations found - TTA statistics not available"]
         
-        print(f"\nConfiguration Used:")
         config = report['config_used']
-        print(f"  Refractory Duration: {config['refractory_duration_s']}s")
-        print(f"  Confirmation Window: {config['confirm_window_s']}s")
-        print(f"  Detection Threshold: {config['detection_threshold']}")
+        lines += [
+            "",
+            "Configuration Used:",
+            f"  Refractory Duration: {config['refractory_duration_s']}s",
+            f"  Confirmation Window: {config['confirm_window_s']}s",
+            f"  Detection Threshold: {config['detection_threshold']}",
+        ]
         
         if '_metadata' in report:
             metadata = report['_metadata']
             if 'generated_at' in metadata:
-                print(f"\nReport Generated: {metadata['generated_at']}")
+                lines += ["", f"Report Generated: {metadata['generated_at']}"]
             if 'output_path' in metadata and metadata.get('save_success'):
-                print(f"Report Saved: {metadata['output_path']}")
+                lines.append(f"Report Saved: {metadata['output_path']}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def print_summary(self, report: Dict[str, Any]) -> None:
+        """
+        Print a human-readable summary of the quality report.
+        
+        Args:
+            report: Quality report dictionary.
+        """
+        sys.stdout.write(self.format_summary(report))
+        sys.stdout.flush()
 
 
 def generate_quality_report(
@@ -329,8 +693,6 @@ def generate_quality_report(
 
 if __name__ == "__main__":
     # Demo/test the quality reporter
-    import pandas as pd
-    from pathlib import Path
     
     print("Quality Reporter Demo")
     print("=" * 40)
@@ -0,0 +1,97 @@
+"""Compiled exit scans for the trading simulator.
+
+Compiled with numba when it is installed; callers should check
+``NUMBA_AVAILABLE`` and keep the vectorized NumPy scan otherwise, since the
+plain-Python loop is slower than that.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Exit reason codes returned by the kernels
+EXIT_STOP_LOSS = 0
+EXIT_TAKE_PROFIT = 1
+EXIT_TIME = 2
+EXIT_DATA_END = 3
+EXIT_REASONS = ("stop_loss", "take_profit", "time_exit", "data_end")
+
+
+@njit(cache=True)
+def find_exit(ts_ns, prices, rows, entry_price, exit_ns, stop_loss_pct,
+              take_profit_pct):
+    """
+    Scan a stock's rows after entry for the first one that triggers an exit.
+
+    Args:
+        ts_ns: Sorted feature timestamps (int64 ns).
+        prices: Feature prices (float64).
+        rows: Ascending row positions of the trade's stock after entry.
+        entry_price: Entry price including slippage.
+        exit_ns: Time-based exit timestamp (int64 ns).
+        stop_loss_pct, take_profit_pct: Exit thresholds.
+
+    Returns:
+        tuple: (exit row, exit reason code); the last feature row with
+            EXIT_DATA_END if no row triggers.
+    """
+    for k in range(rows.shape[0]):
+        i = rows[k]
+        price_return = (prices[i] - entry_price) / entry_price
+        if price_return <= -stop_loss_pct:
+            return i, EXIT_STOP_LOSS
+        if price_return >= take_profit_pct:
+            return i, EXIT_TAKE_PROFIT
+        if ts_ns[i] >= exit_ns:
+            return i, EXIT_TIME
+    return prices.shape[0] - 1, EXIT_DATA_END
+
+
+@njit(parallel=True, cache=True)
+def find_exits_batch(ts_ns, prices, stock_rows, scan_starts, scan_ends,
+                     entry_prices, exit_ns, event_indices, stop_loss_pct,
+                     take_profit_pct):
+    """
+    Run find_exit for many events in parallel.
+
+    Exits do not depend on capital, so events are independent here; the
+    caller applies capital in event order afterwards.
+
+    Args:
+        ts_ns: Sorted feature timestamps (int64 ns).
+        prices: Feature prices (float64).
+        stock_rows: Row positions grouped by stock, ascending within each.
+        scan_starts, scan_ends: Per event, the stock_rows range after entry.
+        entry_prices: Per event entry price including slippage.
+        exit_ns: Per event time-based exit timestamp (int64 ns).
+        event_indices: Events to scan.
+        stop_loss_pct, take_profit_pct: Exit thresholds.
+
+    Returns:
+        tuple: (exit rows int64, exit reason codes int8), aligned with
+            event_indices.
+    """
+    n = event_indices.shape[0]
+    exit_rows = np.empty(n, dtype=np.int64)
+    exit_codes = np.empty(n, dtype=np.int8)
+    for j in prange(n):
+        e = event_indices[j]
+        i, code = find_exit(
+            ts_ns, prices, stock_rows[scan_starts[e]:scan_ends[e]],
+            entry_prices[e], exit_ns[e], stop_loss_pct, take_profit_pct
+        )
+        exit_rows[j] = i
+        exit_codes[j] = code
+    return exit_rows, exit_codes
@@ -3,15 +3,23 @@
 import pandas as pd
 import numpy as np
 import json
+import fractions
+import math
+import queue
 import time
 import threading
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime, timedelta
 import logging
 
 from ..config_loader import Config, load_config
-from ..features.core_indicators import calculate_core_indicators
+from ..features.core_indicators import CoreIndicators
+from ..features._live_kernels import (
+    COMPILED_KERNELS_AVAILABLE, LATEST_FEATURE_NAMES, RollingSecondVolume,
+    live_latest_features, live_clipped_log_return, live_microprice
+)
 from ..ml.window_features import generate_window_features
 from ..detection.candidate_detector import CandidateDetector
 from ..detection.confirm_hybrid import HybridConfirmDetector
@@ -19,6 +27,9 @@ from ..event_store import EventStore, create_event
 
 logger = logging.getLogger(__name__)
 
+# Queue sentinel telling the event writer thread to flush and exit
+_WRITER_STOP = object()
+
 
 class DummyAPI:
     """Dummy trading API for testing and simulation."""
@@ -55,7 +66,7 @@ class DummyAPI:
             "stock_code": stock_code,
             "quantity": quantity,
             "price": price,
-            "order_id": f"BUY_{int(time.time() * 1000)}"
+            "order_id": f"BUY_{time.time_ns() // 1_000_000}"
         }
 
     def sell_order(self, stock_code: str, quantity: int, price: float) -> Dict[str, Any]:
@@ -75,7 +86,7 @@ class DummyAPI:
             "stock_code": stock_code,
             "quantity": quantity,
             "price": price,
-            "order_id": f"SELL_{int(time.time() * 1000)}"
+            "order_id": f"SELL_{time.time_ns() // 1_000_000}"
         }
 
     def get_positions(self) -> Dict[str, Dict[str, float]]:
@@ -83,11 +94,234 @@ class DummyAPI:
         return self.positions.copy()
 
 
+class _SymbolShard:
+    """
+    Live state for one stock code.
+
+    Each shard owns a per-column NumPy ring buffer of its ticks, optional
+    running volume statistics and its own candidate detector (whose CPD gate
+    is stateful), so indicators are never computed over a mix of symbols.
+    """
+
+    def __init__(self, stock_code: str, buffer_size: int,
+                 candidate_detector: CandidateDetector,
+                 vol_window: int, is_cumulative: bool, incremental: bool):
+        """
+        Initialize an empty shard.
+
+        Args:
+            stock_code: Stock code this shard buffers.
+            buffer_size: Ticks kept in the ring buffer.
+            candidate_detector: Detector dedicated to this shard.
+            vol_window: Rolling window, in seconds, for the volume z-score.
+            is_cumulative: Whether volume is cumulative.
+            incremental: Maintain O(1) running volume statistics.
+        """
+        self.stock_code = stock_code
+        self.buffer_size = buffer_size
+        self.candidate_detector = candidate_detector
+        self.vol_window = vol_window
+        self.is_cumulative = is_cumulative
+
+        self._cols: Dict[str, np.ndarray] = {}
+        self._head = 0  # Next slot to write
+        self._count = 0  # Filled slots (<= buffer_size)
+
+        # O(1) running volume statistics; calculate_core_indicators stays the
+        # reference implementation when this is off
+        self.volume_stats = self._new_volume_stats() if incremental else None
+
+    @property
+    def count(self) -> int:
+        """Number of buffered ticks."""
+        return self._count
+
+    @staticmethod
+    def _new_buffer_column(value: Any, size: int) -> np.ndarray:
+        """Allocate a ring buffer column with a dtype suited to the first value seen."""
+        if isinstance(value, (bool, np.bool_)):
+            return np.full(size, None, dtype=object)
+        if isinstance(value, (int, float, np.integer, np.floating)):
+            # float64 for ints too: exact to 2**53 and never truncates a later float
+            return np.full(size, np.nan, dtype=np.float64)
+        if isinstance(value, (datetime, np.datetime64)):
+            return np.full(size, np.datetime64('NaT'), dtype='datetime64[ns]')
+        return np.full(size, None, dtype=object)
+
+    def append(self, tick_data: Dict[str, Any]):
+        """
+        Write one tick into the ring buffer and running statistics in O(1).
+
+        Args:
+            tick_data: Dictionary containing tick data.
+        """
+        buffer_full = self._count == self.buffer_size
+        head = self._head
+        for key, value in tick_data.items():
+            col = self._cols.get(key)
+            if col is None:
+                col = self._cols[key] = self._new_buffer_column(value, self.buffer_size)
+            try:
+                col[head] = value
+            except (TypeError, ValueError, OverflowError):
+                # Value doesn't fit the inferred dtype; widen the column once
+                col = self._cols[key] = col.astype(object)
+                col[head] = value
+
+        self._head = (head + 1) % self.buffer_size
+        self._count = min(self._count + 1, self.buffer_size)
+
+        if self.volume_stats is not None:
+            self._update_volume_stats(tick_data, evict=buffer_full)
+
+    def window(self, key: str) -> np.ndarray:
+        """Buffered values of one column, oldest first."""
+        col = self._cols[key]
+        if self._count < self.buffer_size:
+            return col[:self._count]
+        # Full buffer: oldest row sits at the write head
+        return np.concatenate((col[self._head:], col[:self._head]))
+
+    def to_frame(self, copy: bool = True) -> pd.DataFrame:
+        """
+        Buffered ticks as a DataFrame, oldest first.
+
+        Args:
+            copy: Copy the column arrays. With False, columns are views into
+                the ring buffer until it wraps, so the frame must not be
+                written to in place (adding or replacing columns is fine) and
+                must not outlive the next tick.
+
+        Returns:
+            pd.DataFrame: One row per buffered tick.
+        """
+        return pd.DataFrame({k: self.window(k) for k in self._cols}, copy=copy)
+
+    def seconds(self) -> Optional[np.ndarray]:
+        """Buffered timestamps as int64 epoch seconds, oldest first (None if not time-like)."""
+        ts = self.window('ts')
+        if np.issubdtype(ts.dtype, np.datetime64):
+            return ts.view(np.int64) // 1_000_000_000
+        if ts.dtype == np.float64:
+            return np.floor_divide(ts, 1000).astype(np.int64)
+        return None
+
+    @staticmethod
+    def _tick_seconds(ts: Any) -> int:
+        """Epoch second of a single tick timestamp (datetime or epoch ms)."""
+        if isinstance(ts, (datetime, np.datetime64)):
+            return int(np.datetime64(ts, 'ns').astype(np.int64) // 1_000_000_000)
+        return int(ts // 1000)
+
+    def _new_volume_stats(self) -> RollingSecondVolume:
+        return RollingSecondVolume(self.vol_window, self.is_cumulative)
+
+    def _update_volume_stats(self, tick_data: Dict[str, Any], evict: bool):
+        """
+        Fold the newest tick into the running volume statistics.
+
+        Args:
+            tick_data: Dictionary containing tick data.
+            evict: Whether the tick displaced the oldest buffered tick.
+        """
+        stats = self.volume_stats
+        if stats.valid:
+            if evict:
+                stats.evict()
+            volume = tick_data.get('volume')
+            stats.push(self._tick_seconds(tick_data['ts']),
+                       math.nan if volume is None else float(volume))
+            return
+
+        # A tick went back in time; rebuild once the buffer is ordered again
+        ts_sec = self.seconds()
+        if ts_sec is None or 'volume' not in self._cols or np.any(np.diff(ts_sec) < 0):
+            return
+        stats = self.volume_stats = self._new_volume_stats()
+        for sec, volume in zip(ts_sec.tolist(), self.window('volume').tolist()):
+            stats.push(sec, float(volume))
+
+    def latest_features_incremental(self) -> Optional[List[float]]:
+        """
+        Compute core indicators for the newest tick in O(1).
+
+        Price and friction indicators only need the last three ticks; volume
+        indicators come from the running per-second statistics.
+
+        Returns:
+            Optional[List[float]]: Same values as latest_features_native, or
+                None if the running statistics are off or being rebuilt.
+        """
+        stats = self.volume_stats
+        if stats is None or not stats.valid or self._count < 3:
+            return None
+        for key in ('price', 'bid1', 'ask1', 'bid_qty1', 'ask_qty1'):
+            col = self._cols.get(key)
+            if col is None or col.dtype != np.float64:
+                return None
+
+        i1, i2, i3 = ((self._head - k) % self.buffer_size for k in (1, 2, 3))
+        price, bid1, ask1 = self._cols['price'], self._cols['bid1'], self._cols['ask1']
+        bid_qty1, ask_qty1 = self._cols['bid_qty1'], self._cols['ask_qty1']
+
+        ret = live_clipped_log_return(price[i1], price[i2])
+        accel = ret - live_clipped_log_return(price[i2], price[i3])
+        spread = (ask1[i1] - bid1[i1]) / ((ask1[i1] + bid1[i1]) / 2)
+        micro = live_microprice(bid1[i1], ask1[i1], bid_qty1[i1], ask_qty1[i1])
+        micro_slope = micro - live_microprice(bid1[i2], ask1[i2], bid_qty1[i2], ask_qty1[i2])
+        vol_1s, ticks_per_sec, z_vol = stats.latest()
+
+        values = (ret, accel, vol_1s, ticks_per_sec, z_vol, spread, micro, micro_slope)
+        return [0.0 if v != v else float(v) for v in values]
+
+    def latest_features_native(self) -> Optional[np.ndarray]:
+        """
+        Compute core indicators for the newest tick with the compiled kernel.
+
+        Returns:
+            Optional[np.ndarray]: Last-row values of ``calculate_core_indicators``
+                in LATEST_FEATURE_NAMES order, or None if the buffer lacks the
+                numeric columns the kernel needs.
+        """
+        inputs = []
+        for key in ('price', 'volume', 'bid1', 'ask1', 'bid_qty1', 'ask_qty1'):
+            col = self._cols.get(key)
+            if col is None or col.dtype != np.float64:
+                return None
+            inputs.append(self.window(key))
+
+        ts_sec = self.seconds()
+        if ts_sec is None:
+            return None
+
+        return live_latest_features(*inputs, ts_sec, bool(self.is_cumulative), int(self.vol_window))
+
+    def tail_rows(self, lookback_s: int, min_rows: int) -> int:
+        """
+        Number of trailing rows within ``lookback_s`` seconds of the newest tick.
+
+        Args:
+            lookback_s: Lookback in whole seconds.
+            min_rows: Lower bound on the returned count.
+
+        Returns:
+            int: Row count (all rows if timestamps are not time-like).
+        """
+        secs = self.seconds()
+        if secs is None:
+            return self._count
+        start = np.searchsorted(secs, secs[-1] - lookback_s, side='left')
+        return max(min_rows, len(secs) - int(start))
+
+
 class LiveRunner:
     """
     Live trading runner for real-time onset detection and execution.
     """
 
+    # Position slots preallocated up front (the arrays grow if exceeded)
+    INITIAL_POSITION_SLOTS = 64
+
     def __init__(self, config: Optional[Config] = None):
         """
         Initialize live runner.
@@ -118,22 +352,59 @@ class LiveRunner:
                 self.account_no = getattr(live_config, 'account_no', '1234567890')
                 self.risk_limit_pct = getattr(live_config, 'risk_limit_pct', 0.05)
 
+        # Risk limit as an exact ratio for integer position sizing
+        self._risk_limit_num, self._risk_limit_den = (
+            fractions.Fraction(self.risk_limit_pct).limit_denominator(10000).as_integer_ratio()
+        )
+
+        # Exit rules, resolved once rather than per tick
+        simulator_config = getattr(trading_config, 'simulator', None)
+        if simulator_config is not None:
+            self._hold_time_s = getattr(simulator_config, 'hold_time_s', 60)
+            self._stop_loss_pct = getattr(simulator_config, 'stop_loss_pct', 0.01)
+            self._take_profit_pct = getattr(simulator_config, 'take_profit_pct', 0.02)
+        else:
+            self._hold_time_s = 60
+            self._stop_loss_pct = 0.01
+            self._take_profit_pct = 0.02
+        self._hold_time_ns = int(self._hold_time_s * 1e9)
+        self._fee_rate = 0.0005  # Assumed fee rate
+
+        ml_config = getattr(self.config, 'ml', None)
+        self._ml_enabled = bool(ml_config and getattr(ml_config, 'enabled', True))
+
+        volume_config = self.config.volume
+        self._vol_window = getattr(volume_config, 'roll_window_s', 300)
+        self._is_cumulative = getattr(volume_config, 'is_cumulative', True)
+
         # Initialize trading API
         self.api = self._initialize_api()
 
         # Initialize detection components
-        self.candidate_detector = CandidateDetector(self.config)
+        self.indicators = CoreIndicators(self.config)
         self.confirm_detector = HybridConfirmDetector(self.config)
+        self.confirm_window_rows = 30  # Min rows passed to confirmation (see _confirm_rows)
 
-        # Data buffer for features
-        self.data_buffer = pd.DataFrame()
+        # Per-stock-code shards, each with its own tick ring buffer and
+        # candidate detector; created on a code's first tick
         self.buffer_size = 300  # Keep last 5 minutes of data (1s intervals)
+        self._shards: Dict[Any, _SymbolShard] = {}
+        self._incremental_live = getattr(self.config.features, 'incremental_live', False)
+        self._candidate_event_store = self.confirm_detector.event_store
+
+        # Ticks handed over by producer threads via submit_tick; unbounded so
+        # a producer outpacing the detection loop never drops ticks
+        self._pending_ticks = deque()
 
-        # Position tracking
-        self.active_positions = {}
+        # Position tracking: struct-of-arrays indexed by slot, plus stock -> slot
+        self._pos_index: Dict[str, int] = {}
+        self._allocate_positions(self.INITIAL_POSITION_SLOTS)
 
-        # Event store for trades
+        # Event store for trades, written by a background thread
         self.event_store = EventStore(self.trades_file)
+        self.event_fsync_interval_s = 1.0  # Max delay before written events are fsynced
+        self._event_q: "queue.Queue" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
 
         logger.info(f"Live runner initialized")
         logger.info(f"API: {self.api_type}, Account: {self.account_no}")
@@ -169,6 +440,8 @@ class LiveRunner:
         # Create reports directory
         Path("reports").mkdir(exist_ok=True)
 
+        self._start_event_writer()
+
         # Start data processing loop
         if data_callback:
             self._run_with_callback(data_callback)
@@ -179,6 +452,113 @@ class LiveRunner:
         """Stop live trading runner."""
         self.is_running = False
         logger.info("Stopping live trading runner...")
+        self._stop_event_writer()
+
+    def _start_event_writer(self):
+        """Start the background thread that persists trade events."""
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            return
+        self._writer_thread = threading.Thread(
+            target=self._event_writer_loop, name="live-event-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _stop_event_writer(self):
+        """Flush queued events and stop the writer thread."""
+        thread = self._writer_thread
+        if thread is not None and thread is not threading.current_thread():
+            self._writer_thread = None
+            self._event_q.put(_WRITER_STOP)
+            thread.join()
+
+        # Anything queued after the sentinel (e.g. a tick finishing during stop)
+        leftover = []
+        while True:
+            try:
+                item = self._event_q.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _WRITER_STOP:
+                leftover.append(item)
+        if leftover:
+            self.event_store.save_events(leftover, fsync=True)
+
+    def _record_event(self, event: Dict[str, Any]):
+        """
+        Persist an event off the detection path.
+
+        Args:
+            event: Event dictionary.
+        """
+        if self._writer_thread is None:
+            self.event_store.save_events([event])
+        else:
+            self._event_q.put(event)
+
+    def _event_writer_loop(self):
+        """
+        Drain the event queue in batches (group commit).
+
+        Each wakeup writes everything queued so far with one append on a file
+        descriptor held open for the thread's lifetime. Written data is synced
+        within event_fsync_interval_s, including when the queue then goes
+        idle, and on shutdown.
+        """
+        event_q = self._event_q
+        last_sync = time.monotonic()
+        unsynced = False
+
+        with self.event_store.appender() as out:
+            while True:
+                if unsynced:
+                    # Wake up by the sync deadline even if no event arrives
+                    timeout = max(0.0, last_sync + self.event_fsync_interval_s - time.monotonic())
+                    try:
+                        first = event_q.get(timeout=timeout)
+                    except queue.Empty:
+                        try:
+                            out.sync()
+                        except Exception as e:
+                            logger.error(f"Error syncing events: {e}")
+                        last_sync = time.monotonic()
+                        unsynced = False
+                        continue
+                else:
+                    first = event_q.get()
+
+                batch = [first]
+                while True:
+                    try:
+                        batch.append(event_q.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stopping = any(item is _WRITER_STOP for item in batch)
+                events = [item for item in batch if item is not _WRITER_STOP]
+
+                try:
+                    try:
+                        written = out.write(events)
+                    except ValueError:
+                        # Don't let one malformed event drop the whole batch
+                        written = 0
+                        for event in events:
+                            try:
+                                written += out.write([event])
+                            except ValueError as e:
+                                logger.error(f"Dropping invalid event: {e}")
+                    if written:
+                        unsynced = True
+                    now = time.monotonic()
+                    if unsynced and (stopping or now - last_sync >= self.event_fsync_interval_s):
+                        out.sync()
+                        last_sync = now
+                        unsynced = False
+                except Exception as e:
+                    logger.error(f"Error writing events: {e}")
+
+                if stopping:
+                    return
 
     def _run_with_simulated_data(self):
         """Run with simulated market data for testing."""
@@ -188,14 +568,25 @@ class LiveRunner:
         start_time = datetime.now()
         price = 70000
 
+        # Random draws are generated in batches and consumed one per tick
+        rng = np.random.default_rng()
+        batch = 10_000
+        rand_idx = batch
+
         try:
             while self.is_running:
                 # Generate next tick
                 current_time = datetime.now()
 
+                if rand_idx == batch:
+                    price_moves = (rng.standard_normal(batch) * 50).tolist()
+                    volumes = rng.integers(100, 1000, size=batch).tolist()
+                    rand_idx = 0
+
                 # Random price movement
-                price += np.random.randn() * 50
-                volume = np.random.randint(100, 1000)
+                price += price_moves[rand_idx]
+                volume = volumes[rand_idx]
+                rand_idx += 1
 
                 # Create tick data
                 tick_data = {
@@ -222,24 +613,100 @@ class LiveRunner:
         finally:
             self.stop()
 
+    def submit_tick(self, tick_data: Dict[str, Any]):
+        """
+        Queue a tick from a producer thread.
+
+        Queued ticks are drained by the callback loop and detected as one batch.
+        The queue is unbounded: no tick is dropped when producers outpace the
+        loop, at the cost of memory growing until the loop catches up.
+
+        Args:
+            tick_data: Dictionary containing tick data.
+        """
+        self._pending_ticks.append(tick_data)
+
     def _run_with_callback(self, data_callback: Callable):
-        """Run with external data callback."""
+        """
+        Run with external data callback.
+
+        The callback may return a single tick dict or a list of ticks. All
+        ticks received in one iteration (plus any queued via submit_tick) are
+        buffered first and detection runs once on the latest state.
+        """
         logger.info("Running with external data callback")
 
         try:
             while self.is_running:
+                # Ticks queued by producers arrived before this callback's data
+                ticks = []
+                pending = self._pending_ticks
+                while pending:
+                    ticks.append(pending.popleft())
+
                 # Get data from callback
-                tick_data = data_callback()
-                if tick_data:
-                    self._process_tick(tick_data)
+                data = data_callback()
+                if isinstance(data, dict):
+                    ticks.append(data)
+                elif data:
+                    ticks.extend(data)
 
-                time.sleep(0.1)  # Small delay to prevent excessive CPU usage
+                if ticks:
+                    self._process_ticks(ticks)
+                else:
+                    time.sleep(0.1)  # Idle: small delay to prevent excessive CPU usage
 
         except Exception as e:
             logger.error(f"Error in live runner with callback: {e}")
         finally:
             self.stop()
 
+    def _shard(self, stock_code: Any) -> _SymbolShard:
+        """Get (or create) the shard buffering a stock code."""
+        shard = self._shards.get(stock_code)
+        if shard is None:
+            detector = CandidateDetector(self.config, event_store=self._candidate_event_store)
+            shard = self._shards[stock_code] = _SymbolShard(
+                stock_code, self.buffer_size, detector,
+                self._vol_window, self._is_cumulative, self._incremental_live
+            )
+        return shard
+
+    @property
+    def data_buffer(self) -> pd.DataFrame:
+        """Buffered ticks of all stock codes as one DataFrame, oldest first per code."""
+        frames = [shard.to_frame() for shard in self._shards.values() if shard.count]
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def _calculate_features(self, shard: _SymbolShard, use_ml: bool) -> pd.DataFrame:
+        """Calculate indicators (and window features if ML is enabled) over a shard's buffer."""
+        # add_indicators only adds columns, so the buffer view needs no copy
+        features_df = self.indicators.add_indicators(shard.to_frame(copy=False), copy=False)
+        if use_ml:
+            features_df = generate_window_features(features_df, self.config)
+        return features_df
+
+    def _confirm_rows(self, shard: _SymbolShard) -> int:
+        """
+        Number of trailing buffer rows confirmation needs.
+
+        Candidates come from the newest tick, so the confirm detector only
+        reads rows inside its pre-window before it. Returns the rows within
+        that lookback (whole seconds, rounded out), but at least
+        ``confirm_window_rows``.
+        """
+        return shard.tail_rows(self.confirm_detector.pre_window_s + 1, self.confirm_window_rows)
+
+    def _buffer_tick(self, tick_data: Dict[str, Any]) -> _SymbolShard:
+        """Append a tick to its stock code's shard and return the shard."""
+        shard = self._shard(tick_data['stock_code'])
+        shard.append(tick_data)
+        return shard
+
     def _process_tick(self, tick_data: Dict[str, Any]):
         """
         Process incoming tick data.
@@ -247,178 +714,276 @@ class LiveRunner:
         Args:
             tick_data: Dictionary containing tick data.
         """
-        # Add to buffer
-        new_row = pd.DataFrame([tick_data])
-        self.data_buffer = pd.concat([self.data_buffer, new_row], ignore_index=True)
+        shard = self._buffer_tick(tick_data)
+        self._run_detection(shard, tick_data)
+
+    def _process_ticks(self, ticks: List[Dict[str, Any]]):
+        """
+        Process a burst of ticks with one detection pass per stock code.
 
-        # Maintain buffer size
-        if len(self.data_buffer) > self.buffer_size:
-            self.data_buffer = self.data_buffer.tail(self.buffer_size).reset_index(drop=True)
+        Args:
+            ticks: Tick dictionaries, oldest first.
+        """
+        latest = {}
+        for tick_data in ticks:
+            shard = self._buffer_tick(tick_data)
+            latest[shard.stock_code] = (shard, tick_data)
+        for shard, tick_data in latest.values():
+            self._run_detection(shard, tick_data)
+
+    def _run_detection(self, shard: _SymbolShard, tick_data: Dict[str, Any]):
+        """
+        Run detection, confirmation and exit checks against a shard's buffered state.
 
+        Args:
+            shard: Shard the tick was buffered in.
+            tick_data: Most recent tick of that shard.
+        """
         # Need sufficient data for features
-        if len(self.data_buffer) < 60:  # Need at least 1 minute of data
+        if shard.count < 60:  # Need at least 1 minute of data
             return
 
         try:
-            # Calculate features
-            features_df = calculate_core_indicators(self.data_buffer.copy())
-
-            # Generate window features if ML is enabled
-            ml_config = getattr(self.config, 'ml', None)
-            if ml_config and getattr(ml_config, 'enabled', True):
-                features_df = generate_window_features(features_df, self.config)
+            use_ml = self._ml_enabled
+            price = tick_data['price']
+
+            # Candidate detection only reads the newest row; without window
+            # features it can come from the compiled kernel
+            features_df = None
+            values = None
+            if shard.volume_stats is not None and not use_ml:
+                values = shard.latest_features_incremental()
+            elif COMPILED_KERNELS_AVAILABLE and not use_ml:
+                values = shard.latest_features_native()
 
             # Check for onset candidates
-            latest_features = features_df.tail(1)
-            candidates = self.candidate_detector.detect_candidates(latest_features)
+            if values is not None:
+                # The tick itself supplies ts, stock_code and prices
+                candidate = shard.candidate_detector.detect_from_array(
+                    values, LATEST_FEATURE_NAMES, tick_data
+                )
+            else:
+                features_df = self._calculate_features(shard, use_ml)
+                candidate = shard.candidate_detector.detect_row(features_df.iloc[-1])
+            candidates = [candidate] if candidate is not None else []
 
             if candidates:
-                logger.info(f"Found {len(candidates)} candidates at {tick_data['ts']}")
+                logger.info("Found %d candidates at %s", len(candidates), tick_data['ts'])
+
+                # Indicators need the whole buffer; confirmation only its tail
+                if features_df is None:
+                    features_df = self._calculate_features(shard, use_ml)
 
                 # Check confirmation
-                confirmed_events = self.confirm_detector.confirm_candidates(features_df, candidates)
+                confirmed_events = self.confirm_detector.confirm_candidates(
+                    features_df.tail(self._confirm_rows(shard)), candidates
+                )
 
                 if confirmed_events:
-                    logger.info(f"Confirmed {len(confirmed_events)} events")
+                    logger.info("Confirmed %d events", len(confirmed_events))
 
                     for event in confirmed_events:
-                        self._execute_trade(event, tick_data)
+                        self._execute_trade(event, price)
 
             # Check existing positions for exit conditions
-            self._check_position_exits(tick_data)
+            self._check_position_exits(shard.stock_code, price)
 
         except Exception as e:
             logger.error(f"Error processing tick: {e}")
 
-    def _execute_trade(self, confirmed_event: Dict[str, Any], current_tick: Dict[str, Any]):
+    def _allocate_positions(self, n_slots: int):
+        """Allocate (or grow to) n_slots position slots, keeping existing ones."""
+        def grow(old: Optional[np.ndarray], dtype, fill) -> np.ndarray:
+            new = np.full(n_slots, fill, dtype=dtype)
+            if old is not None:
+                new[:len(old)] = old
+            return new
+
+        self._pos_active = grow(getattr(self, '_pos_active', None), bool, False)
+        self._pos_entry_price = grow(getattr(self, '_pos_entry_price', None), np.float64, np.nan)
+        self._pos_last_price = grow(getattr(self, '_pos_last_price', None), np.float64, np.nan)
+        self._pos_qty = grow(getattr(self, '_pos_qty', None), np.int64, 0)
+        self._pos_entry_ts_ns = grow(getattr(self, '_pos_entry_ts_ns', None), np.int64, 0)
+        self._pos_entry_mono_ns = grow(getattr(self, '_pos_entry_mono_ns', None), np.int64, 0)
+        self._pos_onset_strength = grow(getattr(self, '_pos_onset_strength', None), np.float64, np.nan)
+        self._pos_stock = grow(getattr(self, '_pos_stock', None), object, None)
+        self._pos_order_id = grow(getattr(self, '_pos_order_id', None), object, None)
+
+    def _open_position(self, stock_code: str, quantity: int, price: float,
+                       order_id: str, onset_strength: float):
+        """Track a new position (replacing any existing one for the stock)."""
+        slot = self._pos_index.get(stock_code)
+        if slot is None:
+            free = np.flatnonzero(~self._pos_active)
+            if free.size == 0:
+                slot = len(self._pos_active)
+                self._allocate_positions(2 * slot)
+            else:
+                slot = int(free[0])
+            self._pos_index[stock_code] = slot
+
+        self._pos_active[slot] = True
+        self._pos_stock[slot] = stock_code
+        self._pos_qty[slot] = quantity
+        self._pos_entry_price[slot] = price
+        self._pos_last_price[slot] = price
+        self._pos_entry_ts_ns[slot] = time.time_ns()  # Wall clock, for reporting
+        self._pos_entry_mono_ns[slot] = time.monotonic_ns()  # For the hold-time exit
+        self._pos_order_id[slot] = order_id
+        self._pos_onset_strength[slot] = onset_strength
+
+    def _close_position(self, slot: int):
+        """Release a position slot."""
+        del self._pos_index[self._pos_stock[slot]]
+        self._pos_active[slot] = False
+        self._pos_stock[slot] = None
+        self._pos_order_id[slot] = None
+
+    @property
+    def active_positions(self) -> Dict[str, Dict[str, Any]]:
+        """Open positions by stock code (snapshot built from the position arrays)."""
+        return {
+            stock_code: {
+                "quantity": int(self._pos_qty[slot]),
+                "entry_price": float(self._pos_entry_price[slot]),
+                "entry_time": datetime.fromtimestamp(self._pos_entry_ts_ns[slot] / 1e9),
+                "order_id": self._pos_order_id[slot],
+                "onset_strength": float(self._pos_onset_strength[slot])
+            }
+            for stock_code, slot in self._pos_index.items()
+        }
+
+    def _execute_trade(self, confirmed_event: Dict[str, Any], current_price: float):
         """
         Execute trade based on confirmed onset event.
 
         Args:
             confirmed_event: Confirmed onset event.
-            current_tick: Current market tick data.
+            current_price: Price of the current market tick.
         """
         stock_code = confirmed_event['stock_code']
-        current_price = current_tick['price']
 
-        # Risk management - calculate position size
-        account_balance = self.api.get_balance()
-        max_position_value = account_balance * self.risk_limit_pct
-        position_size = int(max_position_value / current_price)
+        # Risk management - calculate position size in integer KRW; a fractional
+        # price rounds up so the position never exceeds the risk limit
+        account_balance = int(self.api.get_balance())
+        position_size = (account_balance * self._risk_limit_num) // (
+            self._risk_limit_den * math.ceil(current_price)
+        )
 
         if position_size <= 0:
-            logger.warning(f"Position size too small for {stock_code}")
+            logger.warning("Position size too small for %s", stock_code)
             return
 
         # Execute buy order
         order_result = self.api.buy_order(stock_code, position_size, current_price)
 
         if order_result["status"] == "filled":
+            onset_strength = confirmed_event.get('onset_strength', 0.5)
+
             # Record entry
             entry_event = create_event(
-                timestamp=time.time() * 1000,
+                timestamp=time.time_ns() // 1_000_000,
                 event_type="trade_entry",
                 stock_code=stock_code,
                 entry_price=current_price,
                 quantity=position_size,
-                onset_strength=confirmed_event.get('evidence', {}).get('onset_strength', 0.5),
+                onset_strength=onset_strength,
                 order_id=order_result["order_id"],
                 confirmed_from=confirmed_event['confirmed_from']
             )
 
-            self.event_store.add_event(entry_event)
+            self._record_event(entry_event)
 
             # Track position
-            self.active_positions[stock_code] = {
-                "quantity": position_size,
-                "entry_price": current_price,
-                "entry_time": datetime.now(),
-                "order_id": order_result["order_id"],
-                "onset_strength": confirmed_event.get('evidence', {}).get('onset_strength', 0.5)
-            }
+            self._open_position(
+                stock_code, position_size, current_price, order_result["order_id"],
+                onset_strength
+            )
 
-            logger.info(f"TRADE ENTRY: {stock_code} x{position_size} @ {current_price}")
+            logger.info("TRADE ENTRY: %s x%d @ %s", stock_code, position_size, current_price)
         else:
-            logger.warning(f"Trade execution failed: {order_result}")
+            logger.warning("Trade execution failed: %s", order_result)
 
-    def _check_position_exits(self, current_tick: Dict[str, Any]):
+    def _check_position_exits(self, stock_code: Any, price: float):
         """
         Check existing positions for exit conditions.
 
+        The tick updates its stock's last price; exit rules are then evaluated
+        for all open positions in one vectorized pass, each at its last
+        observed price.
+
         Args:
-            current_tick: Current market tick data.
+            stock_code: Stock code of the current market tick.
+            price: Price of the current market tick.
         """
-        stock_code = current_tick['stock_code']
-        current_price = current_tick['price']
-        current_time = datetime.now()
+        slot = self._pos_index.get(stock_code)
+        if slot is not None:
+            self._pos_last_price[slot] = price
 
-        if stock_code not in self.active_positions:
+        if not self._pos_index:
             return
 
-        position = self.active_positions[stock_code]
-        entry_price = position['entry_price']
-        entry_time = position['entry_time']
-        quantity = position['quantity']
+        active = self._pos_active
+        entry_price = self._pos_entry_price
+        price_return = (self._pos_last_price - entry_price) / entry_price
+        time_exit = (time.monotonic_ns() - self._pos_entry_mono_ns) >= self._hold_time_ns
+        stop_loss = price_return <= -self._stop_loss_pct
+        take_profit = price_return >= self._take_profit_pct
+        exit_mask = active & (time_exit | stop_loss | take_profit)
+
+        for slot in np.flatnonzero(exit_mask):
+            # Same precedence as before: time, then stop loss, then take profit
+            if time_exit[slot]:
+                exit_reason = "time_exit"
+            elif stop_loss[slot]:
+                exit_reason = "stop_loss"
+            else:
+                exit_reason = "take_profit"
+            self._exit_position(int(slot), exit_reason)
 
-        # Calculate return
-        price_return = (current_price - entry_price) / entry_price
+    def _exit_position(self, slot: int, exit_reason: str):
+        """
+        Sell a position at its last observed price and record the exit.
 
-        # Get trading config for exit rules
-        trading_config = getattr(self.config, 'trading', None)
-        if trading_config and hasattr(trading_config, 'simulator'):
-            simulator_config = trading_config.simulator
-            hold_time_s = getattr(simulator_config, 'hold_time_s', 60)
-            stop_loss_pct = getattr(simulator_config, 'stop_loss_pct', 0.01)
-            take_profit_pct = getattr(simulator_config, 'take_profit_pct', 0.02)
-        else:
-            hold_time_s = 60
-            stop_loss_pct = 0.01
-            take_profit_pct = 0.02
-
-        exit_reason = None
-
-        # Check time-based exit
-        if (current_time - entry_time).total_seconds() >= hold_time_s:
-            exit_reason = "time_exit"
-
-        # Check stop loss
-        elif price_return <= -stop_loss_pct:
-            exit_reason = "stop_loss"
-
-        # Check take profit
-        elif price_return >= take_profit_pct:
-            exit_reason = "take_profit"
-
-        if exit_reason:
-            # Execute sell order
-            order_result = self.api.sell_order(stock_code, quantity, current_price)
-
-            if order_result["status"] == "filled":
-                # Calculate PnL
-                gross_pnl = quantity * (current_price - entry_price)
-                fees = quantity * (entry_price + current_price) * 0.0005  # Assumed fee rate
-                net_pnl = gross_pnl - fees
-
-                # Record exit
-                exit_event = create_event(
-                    timestamp=time.time() * 1000,
-                    event_type="trade_exit",
-                    stock_code=stock_code,
-                    exit_price=current_price,
-                    quantity=quantity,
-                    gross_pnl=gross_pnl,
-                    net_pnl=net_pnl,
-                    exit_reason=exit_reason,
-                    order_id=order_result["order_id"],
-                    entry_order_id=position["order_id"],
-                    onset_strength=position["onset_strength"]
-                )
+        Args:
+            slot: Position slot.
+            exit_reason: Why the position is being closed.
+        """
+        stock_code = self._pos_stock[slot]
+        quantity = int(self._pos_qty[slot])
+        entry_price = float(self._pos_entry_price[slot])
+        current_price = float(self._pos_last_price[slot])
+
+        # Execute sell order
+        order_result = self.api.sell_order(stock_code, quantity, current_price)
+
+        if order_result["status"] == "filled":
+            # Calculate PnL
+            gross_pnl = quantity * (current_price - entry_price)
+            fees = quantity * (entry_price + current_price) * self._fee_rate
+            net_pnl = gross_pnl - fees
+
+            # Record exit
+            exit_event = create_event(
+                timestamp=time.time_ns() // 1_000_000,
+                event_type="trade_exit",
+                stock_code=stock_code,
+                exit_price=current_price,
+                quantity=quantity,
+                gross_pnl=gross_pnl,
+                net_pnl=net_pnl,
+                exit_reason=exit_reason,
+                order_id=order_result["order_id"],
+                entry_order_id=self._pos_order_id[slot],
+                onset_strength=float(self._pos_onset_strength[slot])
+            )
 
-                self.event_store.add_event(exit_event)
+            self._record_event(exit_event)
 
-                # Remove from active positions
-                del self.active_positions[stock_code]
+            # Remove from active positions
+            self._close_position(slot)
 
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(f"TRADE EXIT: {stock_code} x{quantity} @ {current_price}, PnL: {net_pnl:,.0f} KRW ({exit_reason})")
 
     def get_status(self) -> Dict[str, Any]:
@@ -430,8 +995,8 @@ class LiveRunner:
             "is_running": self.is_running,
             "balance": balance,
             "positions": positions,
-            "active_positions": len(self.active_positions),
-            "buffer_size": len(self.data_buffer),
+            "active_positions": len(self._pos_index),
+            "buffer_size": sum(shard.count for shard in self._shards.values()),
             "api_type": self.api_type
         }
 
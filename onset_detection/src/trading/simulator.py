@@ -7,12 +7,35 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Union, Tuple
 from datetime import datetime
 import logging
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 from ..config_loader import Config, load_config
 from ..ml.labeler import load_events_from_jsonl
+from ._sim_njit import (
+    NUMBA_AVAILABLE, EXIT_REASONS, EXIT_STOP_LOSS, EXIT_TAKE_PROFIT, EXIT_TIME,
+    EXIT_DATA_END, find_exits_batch
+)
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Feature columns the simulator reads
+SIMULATION_COLUMNS = ['ts', 'stock_code', 'price']
+
+# Columns of the trades table, in order
+TRADE_COLUMNS = [
+    'trade_id', 'stock_code', 'entry_ts', 'entry_dt', 'entry_price', 'entry_price_actual',
+    'exit_ts', 'exit_dt', 'exit_price', 'exit_price_actual', 'position_size',
+    'gross_pnl', 'fees', 'net_pnl', 'pnl_pct', 'exit_reason', 'capital_after', 'onset_strength'
+]
+
 
 class TradingSimulator:
     """
@@ -56,6 +79,9 @@ class TradingSimulator:
                 self.stop_loss_pct = getattr(simulator_config, 'stop_loss_pct', 0.01)
                 self.take_profit_pct = getattr(simulator_config, 'take_profit_pct', 0.02)
 
+        # Hold time on the int64 ns timeline the simulation runs on
+        self._hold_time_ns = int(self.hold_time_s * 1e9)
+
         logger.info(f"Trading simulator initialized")
         logger.info(f"Capital: {self.capital:,} KRW")
         logger.info(f"Fee rate: {self.fee_rate:.4f}, Slippage: {self.slippage:.4f}")
@@ -80,63 +106,215 @@ class TradingSimulator:
             logger.warning("No data for simulation")
             return pd.DataFrame(), self._create_empty_summary()
 
+        frame, scan = self._prepare_simulation(features_df, confirmed_events)
+
+        # Exits do not depend on capital: scan every resolvable entry first
+        scan_events = np.flatnonzero(scan['entry_rows'] >= 0)
+        exit_rows, exit_codes = _scan_exits(scan, scan_events)
+
+        return self._fold_trades(frame, scan, confirmed_events, scan_events, exit_rows, exit_codes)
+
+    def simulate_trades_parallel(
+        self,
+        features_df: pd.DataFrame,
+        confirmed_events: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Simulate trades with the exit scans of each stock run in a process pool.
+
+        Exit scans are independent per stock and dominate the run time; they
+        are farmed out one stock per task. Position sizing compounds capital
+        across all stocks, so the capital fold stays sequential in event
+        order and the results equal those of simulate_trades.
+
+        Args:
+            features_df: Features DataFrame with price data.
+            confirmed_events: List of confirmed onset events.
+            max_workers: Worker processes (default: CPU count).
+
+        Returns:
+            Tuple: (trades_df, summary_dict).
+        """
+        if features_df.empty or not confirmed_events:
+            logger.warning("No data for simulation")
+            return pd.DataFrame(), self._create_empty_summary()
+
+        frame, scan = self._prepare_simulation(features_df, confirmed_events)
+
+        # Resolvable events grouped by stock, event order kept within each
+        scan_events = np.flatnonzero(scan['entry_rows'] >= 0)
+        by_stock = scan_events[np.argsort(scan['event_code_ids'][scan_events], kind='stable')]
+        splits = np.flatnonzero(np.diff(scan['event_code_ids'][by_stock])) + 1
+        groups = np.split(by_stock, splits) if len(by_stock) else []
+
+        if len(groups) > 1:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_scan_worker,
+                initargs=(scan,)
+            ) as executor:
+                results = list(executor.map(_scan_exits_in_worker, groups))
+        else:
+            results = [_scan_exits(scan, group) for group in groups]
+
+        # Back to event order for the capital fold
+        if results:
+            order = np.argsort(by_stock, kind='stable')
+            exit_rows = np.concatenate([rows for rows, _ in results])[order]
+            exit_codes = np.concatenate([codes for _, codes in results])[order]
+        else:
+            exit_rows = np.empty(0, dtype=np.int64)
+            exit_codes = np.empty(0, dtype=np.int8)
+
+        return self._fold_trades(frame, scan, confirmed_events, scan_events, exit_rows, exit_codes)
+
+    def _prepare_simulation(
+        self,
+        features_df: pd.DataFrame,
+        confirmed_events: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Convert features and events into the arrays the simulation runs on.
+
+        Args:
+            features_df: Features DataFrame with price data.
+            confirmed_events: List of confirmed onset events.
+
+        Returns:
+            Tuple: (frame, scan) where frame holds the feature columns and
+                entry times used to build the trades table, and scan holds
+                the plain arrays and thresholds the exit scan needs.
+        """
         # Required columns check
-        required_cols = ['ts', 'stock_code', 'price']
-        missing_cols = set(required_cols) - set(features_df.columns)
+        missing_cols = set(SIMULATION_COLUMNS) - set(features_df.columns)
         if missing_cols:
             raise ValueError(f"Missing required columns for simulation: {missing_cols}")
 
-        # Sort features by timestamp
-        features_df = features_df.sort_values('ts')
-
-        trades = []
-        current_capital = self.capital
-
-        for event_idx, event in enumerate(confirmed_events):
-            # Get entry signal
-            entry_ts = event['ts']
-            stock_code = event['stock_code']
+        # Sort features by timestamp (streamed data usually already is)
+        if not features_df['ts'].is_monotonic_increasing:
+            features_df = features_df.sort_values('ts', kind='mergesort').reset_index(drop=True)
+
+        # Feature timestamps as int64 ns, converted once for all events, plus
+        # the columns the trade loop reads as plain arrays (no .iloc per trade)
+        ts_raw = features_df['ts'].array
+        ts_dt = pd.to_datetime(features_df['ts'])
+        ts_ns = self._to_ns(ts_dt)
+        prices = features_df['price'].to_numpy(dtype=np.float64)
+        # Stock codes as int32 ids; events map onto the same ids (-1 if absent).
+        # Codes are compared as strings, converted only if not loaded as such
+        stock_codes = features_df['stock_code']
+        if not pd.api.types.is_string_dtype(stock_codes):
+            stock_codes = stock_codes.astype(str)
+        code_ids, code_uniques = pd.factorize(stock_codes)
+        code_ids = code_ids.astype(np.int32)
+        event_code_ids = code_uniques.get_indexer(
+            [str(event['stock_code']) for event in confirmed_events]
+        ).astype(np.int32)
+
+        # Row positions grouped by stock (ascending within each stock), so
+        # exit scans never visit other stocks' rows
+        stock_rows = np.argsort(code_ids, kind='stable')
+        stock_bounds = np.zeros(len(code_uniques) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(code_ids, minlength=len(code_uniques)), out=stock_bounds[1:])
+
+        # Event timestamps converted in one pass, then all entry rows resolved at once
+        entry_dts = self._to_entry_datetimes([event['ts'] for event in confirmed_events])
+        if isinstance(entry_dts, pd.DatetimeIndex):
+            entry_ns = entry_dts.as_unit('ns').asi8
+        else:
+            entry_ns = np.array([dt.value for dt in entry_dts], dtype=np.int64)
+        entry_rows = self._find_nearest_rows(ts_ns, entry_ns)
+
+        # Each event's scan range in stock_rows: its stock's rows after entry.
+        # Keys (stock id, row) ascend along stock_rows, so one searchsorted
+        # resolves the start for all events instead of one search per event
+        n_rows = len(prices)
+        stock_keys = code_ids[stock_rows].astype(np.int64) * n_rows + stock_rows
+        has_stock = event_code_ids >= 0
+        event_keys = event_code_ids.astype(np.int64) * n_rows + entry_rows
+        scan_starts = np.where(has_stock, np.searchsorted(stock_keys, event_keys, side='right'), 0)
+        scan_ends = np.where(has_stock, stock_bounds[event_code_ids + 1], 0)
+
+        # Entry prices with slippage and time-based exit times per event
+        entry_prices_actual = prices[entry_rows] * (1 + self.slippage)
+        exit_ns = entry_ns + self._hold_time_ns
+
+        frame = {
+            "ts_raw": ts_raw,
+            "ts_dt": ts_dt,
+            "entry_dts": entry_dts,
+        }
+        scan = {
+            "ts_ns": ts_ns,
+            "prices": prices,
+            "stock_rows": stock_rows,
+            "scan_starts": scan_starts,
+            "scan_ends": scan_ends,
+            "event_code_ids": event_code_ids,
+            "entry_rows": entry_rows,
+            "entry_prices_actual": entry_prices_actual,
+            "exit_ns": exit_ns,
+            "stop_loss_pct": self.stop_loss_pct,
+            "take_profit_pct": self.take_profit_pct,
+        }
+        return frame, scan
 
-            # Convert timestamp if needed
-            if isinstance(entry_ts, (int, float)):
-                if entry_ts < 1e10:  # Likely seconds
-                    entry_dt = pd.to_datetime(entry_ts, unit='s')
-                else:  # Likely milliseconds
-                    entry_dt = pd.to_datetime(entry_ts, unit='ms')
-            else:
-                entry_dt = pd.to_datetime(entry_ts)
+    def _fold_trades(
+        self,
+        frame: Dict[str, Any],
+        scan: Dict[str, Any],
+        confirmed_events: List[Dict[str, Any]],
+        scan_events: np.ndarray,
+        exit_rows: np.ndarray,
+        exit_codes: np.ndarray
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Size and book trades in event order, compounding capital.
 
-            # Find entry price
-            entry_idx = self._find_nearest_index(features_df, entry_dt)
-            if entry_idx is None:
-                continue
+        Args:
+            frame, scan: Output of _prepare_simulation.
+            confirmed_events: List of confirmed onset events.
+            scan_events: Ascending event positions with a resolved entry row.
+            exit_rows, exit_codes: Exit row and reason code per scan event.
 
-            entry_price = features_df.iloc[entry_idx]['price']
+        Returns:
+            Tuple: (trades_df, summary_dict).
+        """
+        prices = scan['prices']
+        entry_rows = scan['entry_rows']
+        entry_prices_actual = scan['entry_prices_actual']
+        entry_dts = frame['entry_dts']
+
+        # Trade columns, filled by position as trades are taken
+        n_scanned = len(scan_events)
+        trade_events = np.empty(n_scanned, dtype=np.int64)
+        trade_exit_rows = np.empty(n_scanned, dtype=np.int64)
+        trade_exit_codes = np.empty(n_scanned, dtype=np.int8)
+        entry_price_actual_a = np.empty(n_scanned, dtype=np.float64)
+        exit_price_actual_a = np.empty(n_scanned, dtype=np.float64)
+        position_size_a = np.empty(n_scanned, dtype=np.int64)
+        gross_pnl_a = np.empty(n_scanned, dtype=np.float64)
+        fees_a = np.empty(n_scanned, dtype=np.float64)
+        net_pnl_a = np.empty(n_scanned, dtype=np.float64)
+        pnl_pct_a = np.empty(n_scanned, dtype=np.float64)
+        capital_after_a = np.empty(n_scanned, dtype=np.float64)
+        n_trades = 0
+        current_capital = self.capital
 
-            # Apply slippage for entry
-            entry_price_actual = entry_price * (1 + self.slippage)
+        for j in range(n_scanned):
+            event_idx = int(scan_events[j])
+            entry_price_actual = entry_prices_actual[event_idx]
 
             # Calculate position size
             position_size = int(current_capital * 0.95 / entry_price_actual)  # Use 95% of capital
             if position_size == 0:
-                logger.warning(f"Insufficient capital for trade at {entry_dt}")
-                continue
-
-            # Find exit conditions
-            exit_dt = entry_dt + pd.Timedelta(seconds=self.hold_time_s)
-            exit_idx, exit_price, exit_reason = self._find_exit(
-                features_df,
-                entry_idx,
-                entry_price_actual,
-                exit_dt,
-                stock_code
-            )
-
-            if exit_idx is None:
+                logger.warning(f"Insufficient capital for trade at {entry_dts[event_idx]}")
                 continue
 
             # Apply slippage for exit
-            exit_price_actual = exit_price * (1 - self.slippage)
+            exit_idx = exit_rows[j]
+            exit_price_actual = prices[exit_idx] * (1 - self.slippage)
 
             # Calculate PnL
             gross_pnl = position_size * (exit_price_actual - entry_price_actual)
@@ -148,95 +326,173 @@ class TradingSimulator:
             current_capital += net_pnl
 
             # Record trade
-            trade = {
-                "trade_id": f"T{event_idx+1:04d}",
-                "stock_code": stock_code,
-                "entry_ts": entry_ts,
-                "entry_dt": entry_dt,
-                "entry_price": entry_price,
-                "entry_price_actual": entry_price_actual,
-                "exit_ts": features_df.iloc[exit_idx]['ts'],
-                "exit_dt": pd.to_datetime(features_df.iloc[exit_idx]['ts']),
-                "exit_price": exit_price,
-                "exit_price_actual": exit_price_actual,
-                "position_size": position_size,
-                "gross_pnl": gross_pnl,
-                "fees": fees,
-                "net_pnl": net_pnl,
-                "pnl_pct": pnl_pct,
-                "exit_reason": exit_reason,
-                "capital_after": current_capital,
-                "onset_strength": event.get('evidence', {}).get('onset_strength', None)
+            k = n_trades
+            trade_events[k] = event_idx
+            trade_exit_rows[k] = exit_idx
+            trade_exit_codes[k] = exit_codes[j]
+            entry_price_actual_a[k] = entry_price_actual
+            exit_price_actual_a[k] = exit_price_actual
+            position_size_a[k] = position_size
+            gross_pnl_a[k] = gross_pnl
+            fees_a[k] = fees
+            net_pnl_a[k] = net_pnl
+            pnl_pct_a[k] = pnl_pct
+            capital_after_a[k] = current_capital
+            n_trades += 1
+
+        # Create trades DataFrame from the filled columns
+        trade_events = trade_events[:n_trades]
+        trade_exit_rows = trade_exit_rows[:n_trades]
+        events = [confirmed_events[i] for i in trade_events]
+        if n_trades:
+            trades = {
+                "trade_id": [f"T{i+1:04d}" for i in trade_events],
+                "stock_code": [event['stock_code'] for event in events],
+                "entry_ts": [event['ts'] for event in events],
+                "entry_dt": entry_dts.take(trade_events),
+                "entry_price": prices[entry_rows[trade_events]],
+                "entry_price_actual": entry_price_actual_a[:n_trades],
+                "exit_ts": frame['ts_raw'].take(trade_exit_rows),
+                "exit_dt": frame['ts_dt'].array.take(trade_exit_rows),
+                "exit_price": prices[trade_exit_rows],
+                "exit_price_actual": exit_price_actual_a[:n_trades],
+                "position_size": position_size_a[:n_trades],
+                "gross_pnl": gross_pnl_a[:n_trades],
+                "fees": fees_a[:n_trades],
+                "net_pnl": net_pnl_a[:n_trades],
+                "pnl_pct": pnl_pct_a[:n_trades],
+                "exit_reason": trade_exit_codes[:n_trades],
+                "capital_after": capital_after_a[:n_trades],
+                "onset_strength": [event.get('evidence', {}).get('onset_strength', None) for event in events]
             }
-            trades.append(trade)
-
-        # Create trades DataFrame
-        trades_df = pd.DataFrame(trades)
+            trades_df = self._to_trades_frame(trades)
+        else:
+            trades_df = pd.DataFrame()
 
         # Calculate summary statistics
         summary = self._calculate_summary(trades_df, self.capital)
 
         return trades_df, summary
 
-    def _find_nearest_index(
-        self,
-        features_df: pd.DataFrame,
-        target_dt: pd.Timestamp
-    ) -> Optional[int]:
-        """Find the nearest index in features DataFrame."""
-        # Convert features timestamps to datetime for comparison
-        features_ts = pd.to_datetime(features_df['ts'])
-
-        # Find the nearest timestamp
-        time_diff = (features_ts - target_dt).abs()
-        if time_diff.min() > pd.Timedelta(seconds=5):
-            return None
+    @staticmethod
+    def _to_trades_frame(trades: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Build the trades DataFrame, Arrow-backed when pyarrow is available.
 
-        return time_diff.idxmin()
+        Arrow columns write to Parquet/Feather without a copy; stock_code and
+        exit_reason are dictionary-encoded. Columns Arrow cannot type (e.g.
+        stock codes mixing ints and strings) stay as they are.
 
-    def _find_exit(
-        self,
-        features_df: pd.DataFrame,
-        entry_idx: int,
-        entry_price: float,
-        exit_dt: pd.Timestamp,
-        stock_code: str
-    ) -> Tuple[Optional[int], Optional[float], str]:
-        """
-        Find exit conditions (stop loss, take profit, or time-based).
+        Args:
+            trades: Column name -> values; exit_reason holds EXIT_REASONS codes.
 
         Returns:
-            Tuple: (exit_idx, exit_price, exit_reason).
+            pd.DataFrame: Trades table.
         """
-        # Look for exit conditions in subsequent rows
-        for i in range(entry_idx + 1, len(features_df)):
-            row = features_df.iloc[i]
-
-            # Check if same stock
-            if str(row['stock_code']) != str(stock_code):
+        exit_codes = trades.pop("exit_reason")
+        if not PYARROW_AVAILABLE:
+            trades["exit_reason"] = pd.Categorical.from_codes(exit_codes, EXIT_REASONS)
+            return pd.DataFrame(trades)[TRADE_COLUMNS]
+
+        columns = {}
+        for name, values in trades.items():
+            try:
+                array = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                columns[name] = values
                 continue
+            if name == "stock_code":
+                array = array.dictionary_encode()
+            columns[name] = pd.arrays.ArrowExtensionArray(array)
+        columns["exit_reason"] = pd.arrays.ArrowExtensionArray(
+            pa.DictionaryArray.from_arrays(pa.array(exit_codes), pa.array(EXIT_REASONS))
+        )
+        return pd.DataFrame(columns)[TRADE_COLUMNS]
+
+    @staticmethod
+    def _to_entry_datetimes(raw_ts: List[Any]) -> pd.Index:
+        """
+        Convert event timestamps (epoch seconds or milliseconds, strings or
+        datetimes) to datetimes.
 
-            current_price = row['price']
-            current_dt = pd.to_datetime(row['ts'])
-
-            # Calculate return
-            price_return = (current_price - entry_price) / entry_price
-
-            # Check stop loss
-            if price_return <= -self.stop_loss_pct:
-                return i, current_price, "stop_loss"
+        Args:
+            raw_ts: Event 'ts' values.
 
-            # Check take profit
-            if price_return >= self.take_profit_pct:
-                return i, current_price, "take_profit"
+        Returns:
+            pd.Index: DatetimeIndex, or an object Index of Timestamps when the
+                values cannot share one dtype (e.g. mixed time zones).
+        """
+        if all(isinstance(ts, (int, float)) for ts in raw_ts):
+            # Numbers below 1e10 are seconds, the rest milliseconds
+            values = np.asarray(raw_ts)
+            is_seconds = values < 1e10
+            ns = np.empty(len(values), dtype=np.int64)
+            ns[is_seconds] = pd.to_datetime(values[is_seconds], unit='s').as_unit('ns').asi8
+            ns[~is_seconds] = pd.to_datetime(values[~is_seconds], unit='ms').as_unit('ns').asi8
+            return pd.DatetimeIndex(ns.view('datetime64[ns]'))
+
+        # Strings and datetimes alone parse together (numbers among them
+        # would be read as nanoseconds); mixed time zones fall through
+        if not any(isinstance(ts, (int, float)) for ts in raw_ts):
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', FutureWarning)
+                    return pd.DatetimeIndex(pd.to_datetime(raw_ts))
+            except (ValueError, TypeError):
+                pass
+
+        # Mixed kinds or formats: convert one by one
+        entry_dts = []
+        for entry_ts in raw_ts:
+            if isinstance(entry_ts, (int, float)):
+                if entry_ts < 1e10:  # Likely seconds
+                    entry_dts.append(pd.to_datetime(entry_ts, unit='s'))
+                else:  # Likely milliseconds
+                    entry_dts.append(pd.to_datetime(entry_ts, unit='ms'))
+            else:
+                entry_dts.append(pd.to_datetime(entry_ts))
+        return pd.Index(entry_dts)
+
+    @staticmethod
+    def _to_ns(ts: pd.Series) -> np.ndarray:
+        """Datetime series as int64 epoch nanoseconds (UTC for tz-aware input)."""
+        if isinstance(ts.dtype, pd.DatetimeTZDtype):
+            ts = ts.dt.tz_convert(None)
+        return ts.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+    @staticmethod
+    def _find_nearest_rows(
+        ts_ns: np.ndarray,
+        target_ns: np.ndarray,
+        max_gap_ns: int = 5_000_000_000
+    ) -> np.ndarray:
+        """
+        Find the row nearest to each target timestamp.
 
-            # Check time-based exit
-            if current_dt >= exit_dt:
-                return i, current_price, "time_exit"
+        Args:
+            ts_ns: Sorted feature timestamps (int64 ns).
+            target_ns: Target timestamps (int64 ns).
+            max_gap_ns: Largest accepted distance to the nearest row.
 
-        # If no exit found within data, use last available price
-        last_idx = len(features_df) - 1
-        return last_idx, features_df.iloc[last_idx]['price'], "data_end"
+        Returns:
+            np.ndarray: Row position per target (first of equal timestamps),
+                or -1 where no row lies within max_gap_ns.
+        """
+        n = len(ts_ns)
+        if n == 0:
+            return np.full(len(target_ns), -1, dtype=np.int64)
+
+        pos = np.searchsorted(ts_ns, target_ns, side='left')
+        left = np.clip(pos - 1, 0, n - 1)
+        right = np.clip(pos, 0, n - 1)
+        left_diff = np.abs(ts_ns[left] - target_ns)
+        right_diff = np.abs(ts_ns[right] - target_ns)
+
+        # Ties go to the earlier row; step back to the first of duplicate timestamps
+        nearest = np.where(left_diff <= right_diff, left, right)
+        nearest = np.searchsorted(ts_ns, ts_ns[nearest], side='left')
+        min_diff = np.minimum(left_diff, right_diff)
+        return np.where(min_diff <= max_gap_ns, nearest, -1)
 
     def _calculate_summary(
         self,
@@ -247,28 +503,33 @@ class TradingSimulator:
         if trades_df.empty:
             return self._create_empty_summary()
 
+        # PnL column read once; every PnL statistic below comes from it
+        pnl = trades_df['net_pnl'].to_numpy(dtype=np.float64)
+
+        returns = trades_df['pnl_pct'].to_numpy(dtype=np.float64)
+
         # Basic metrics
-        n_trades = len(trades_df)
-        n_wins = len(trades_df[trades_df['net_pnl'] > 0])
-        n_losses = len(trades_df[trades_df['net_pnl'] < 0])
+        n_trades = len(pnl)
+        n_wins = int(np.count_nonzero(pnl > 0))
+        n_losses = int(np.count_nonzero(pnl < 0))
         win_rate = n_wins / n_trades if n_trades > 0 else 0
 
         # PnL metrics
-        total_pnl = trades_df['net_pnl'].sum()
+        total_pnl = pnl.sum()
         total_return = total_pnl / initial_capital
-        avg_pnl = trades_df['net_pnl'].mean()
-        avg_pnl_pct = trades_df['pnl_pct'].mean()
+        avg_pnl = total_pnl / n_trades
+        avg_pnl_pct = returns.mean()
 
         # Risk metrics
         if n_trades > 1:
-            returns = trades_df['pnl_pct'].values
             sharpe = np.sqrt(252) * returns.mean() / returns.std() if returns.std() > 0 else 0
 
             # Calculate MDD
-            cumulative_capital = [initial_capital]
-            for pnl in trades_df['net_pnl'].values:
-                cumulative_capital.append(cumulative_capital[-1] + pnl)
-            cumulative_capital = np.array(cumulative_capital)
+            # Capital after each trade, summed in trade order from the start
+            cumulative_capital = np.empty(n_trades + 1)
+            cumulative_capital[0] = initial_capital
+            cumulative_capital[1:] = pnl
+            np.cumsum(cumulative_capital, out=cumulative_capital)
             running_max = np.maximum.accumulate(cumulative_capital)
             drawdown = (cumulative_capital - running_max) / running_max
             mdd = drawdown.min()
@@ -277,12 +538,13 @@ class TradingSimulator:
             mdd = 0
 
         # Exit reason distribution
-        exit_reasons = trades_df['exit_reason'].value_counts().to_dict()
+        exit_counts = trades_df['exit_reason'].value_counts()
+        exit_reasons = exit_counts[exit_counts > 0].to_dict()
 
         # Average hold time
         if not trades_df.empty:
-            hold_times = (pd.to_datetime(trades_df['exit_dt']) - pd.to_datetime(trades_df['entry_dt'])).dt.total_seconds()
-            avg_hold_time = hold_times.mean()
+            hold_times = pd.to_datetime(trades_df['exit_dt']) - pd.to_datetime(trades_df['entry_dt'])
+            avg_hold_time = (hold_times.to_numpy(dtype='timedelta64[ns]').view(np.int64) / 1e9).mean()
         else:
             avg_hold_time = 0
 
@@ -300,14 +562,14 @@ class TradingSimulator:
             "per_trade": {
                 "avg_pnl": avg_pnl,
                 "avg_pnl_pct": avg_pnl_pct,
-                "max_pnl": trades_df['net_pnl'].max() if not trades_df.empty else 0,
-                "min_pnl": trades_df['net_pnl'].min() if not trades_df.empty else 0,
+                "max_pnl": pnl.max(),
+                "min_pnl": pnl.min(),
                 "avg_hold_time_s": avg_hold_time
             },
             "risk": {
                 "sharpe_ratio": sharpe,
                 "max_drawdown": mdd,
-                "total_fees": trades_df['fees'].sum() if not trades_df.empty else 0
+                "total_fees": trades_df['fees'].to_numpy(dtype=np.float64).sum()
             },
             "exits": exit_reasons,
             "config": {
@@ -357,6 +619,109 @@ class TradingSimulator:
         }
 
 
+def _find_exit(
+    ts_ns: np.ndarray,
+    prices: np.ndarray,
+    rows: np.ndarray,
+    entry_price: float,
+    exit_ns: int,
+    stop_loss_pct: float,
+    take_profit_pct: float
+) -> Tuple[int, int]:
+    """
+    Find exit conditions (stop loss, take profit, or time-based).
+
+    Vectorized NumPy counterpart of the compiled _sim_njit.find_exit, used
+    when numba is not installed.
+
+    Args:
+        ts_ns: Sorted feature timestamps (int64 ns).
+        prices: Feature prices.
+        rows: Ascending row positions of the trade's stock after entry.
+        entry_price: Entry price including slippage.
+        exit_ns: Time-based exit timestamp (int64 ns).
+        stop_loss_pct, take_profit_pct: Exit thresholds.
+
+    Returns:
+        Tuple: (exit_idx, exit reason code indexing EXIT_REASONS).
+    """
+    # First row hitting any exit rule
+    price_return = (prices[rows] - entry_price) / entry_price
+    stop_loss = price_return <= -stop_loss_pct
+    take_profit = price_return >= take_profit_pct
+    hit = stop_loss | take_profit | (ts_ns[rows] >= exit_ns)
+
+    if hit.any():
+        k = int(np.argmax(hit))
+        # Same precedence as the per-row checks: stop loss, take profit, time
+        if stop_loss[k]:
+            exit_code = EXIT_STOP_LOSS
+        elif take_profit[k]:
+            exit_code = EXIT_TAKE_PROFIT
+        else:
+            exit_code = EXIT_TIME
+        return int(rows[k]), exit_code
+
+    # If no exit found within data, use last available price
+    return len(prices) - 1, EXIT_DATA_END
+
+
+def _scan_exits(scan: Dict[str, Any], event_indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exit row and reason code for each given event.
+
+    Args:
+        scan: Scan arrays from TradingSimulator._prepare_simulation.
+        event_indices: Event positions, all with a resolved entry row.
+
+    Returns:
+        Tuple: (exit rows int64, exit reason codes int8).
+    """
+    ts_ns = scan['ts_ns']
+    prices = scan['prices']
+    stock_rows = scan['stock_rows']
+    scan_starts = scan['scan_starts']
+    scan_ends = scan['scan_ends']
+    entry_prices_actual = scan['entry_prices_actual']
+    exit_ns = scan['exit_ns']
+    stop_loss_pct = scan['stop_loss_pct']
+    take_profit_pct = scan['take_profit_pct']
+
+    if NUMBA_AVAILABLE:
+        # One compiled call scans all events, spread over threads
+        return find_exits_batch(
+            ts_ns, prices, stock_rows, scan_starts, scan_ends,
+            entry_prices_actual, exit_ns, np.asarray(event_indices, dtype=np.int64),
+            stop_loss_pct, take_profit_pct
+        )
+
+    exit_rows = np.empty(len(event_indices), dtype=np.int64)
+    exit_codes = np.empty(len(event_indices), dtype=np.int8)
+    for j, event_idx in enumerate(event_indices):
+        # Rows of the event's stock after entry
+        rows = stock_rows[scan_starts[event_idx]:scan_ends[event_idx]]
+        exit_rows[j], exit_codes[j] = _find_exit(
+            ts_ns, prices, rows, entry_prices_actual[event_idx], exit_ns[event_idx],
+            stop_loss_pct, take_profit_pct
+        )
+    return exit_rows, exit_codes
+
+
+# Scan arrays of a process-pool worker, shipped once by its initializer
+_worker_scan: Optional[Dict[str, Any]] = None
+
+
+def _init_scan_worker(scan: Dict[str, Any]):
+    """Process-pool initializer: keep the scan arrays for later tasks."""
+    global _worker_scan
+    _worker_scan = scan
+
+
+def _scan_exits_in_worker(event_indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Process-pool task: exit scan of one stock's events."""
+    return _scan_exits(_worker_scan, event_indices)
+
+
 def run_simulation(
     features_file: Union[str, Path],
     events_file: Union[str, Path],
@@ -366,7 +731,7 @@ def run_simulation(
     Convenience function to run trading simulation.
 
     Args:
-        features_file: Path to features CSV file.
+        features_file: Path to features CSV or Parquet file.
         events_file: Path to confirmed events JSONL file.
         config: Optional configuration object.
 
@@ -375,12 +740,23 @@ def run_simulation(
     """
     simulator = TradingSimulator(config)
 
-    # Load data
-    features_df = pd.read_csv(features_file)
-    events = load_events_from_jsonl(events_file)
-
-    # Filter for confirmed events only
-    confirmed_events = [e for e in events if e.get('event_type') == 'onset_confirmed']
+    # Load data, only the columns the simulation needs
+    features_file = Path(features_file)
+    if features_file.suffix == '.parquet':
+        features_df = pd.read_parquet(features_file, columns=SIMULATION_COLUMNS)
+    elif PYARROW_AVAILABLE:
+        # stock_code stays a string to keep leading zeros
+        features_df = pacsv.read_csv(
+            features_file,
+            convert_options=pacsv.ConvertOptions(
+                column_types={'stock_code': 'string'},
+                include_columns=SIMULATION_COLUMNS
+            )
+        ).to_pandas()
+    else:
+        features_df = pd.read_csv(features_file, usecols=SIMULATION_COLUMNS, dtype={'stock_code': str})
+    # Confirmed events only, filtered while parsing
+    confirmed_events = load_events_from_jsonl(events_file, event_type='onset_confirmed')
     logger.info(f"Found {len(confirmed_events)} confirmed events for simulation")
 
     return simulator.simulate_trades(features_df, confirmed_events)
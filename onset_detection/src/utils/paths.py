@@ -7,6 +7,12 @@ from typing import Union, Optional
 from ..config_loader import Config, load_config
 
 
+def _ensure_dir(abs_path: str) -> None:
+    """Create a directory unless it already exists (one stat on the common path)."""
+    if not os.path.isdir(abs_path):
+        Path(abs_path).mkdir(parents=True, exist_ok=True)
+
+
 class PathManager:
     """Manages paths and ensures directories exist."""
     
@@ -29,6 +35,8 @@ class PathManager:
             self.project_root = current_file.parent.parent.parent  # Go up to project root
         else:
             self.project_root = Path(project_root)
+        
+        self._all_paths: Optional[dict] = None
     
     def get_absolute_path(self, relative_path: Union[str, Path]) -> Path:
         """
@@ -56,7 +64,7 @@ class PathManager:
             Path: Absolute path to the directory.
         """
         abs_path = self.get_absolute_path(path)
-        abs_path.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(str(abs_path))
         return abs_path
     
     def get_data_raw_path(self) -> Path:
@@ -132,17 +140,22 @@ class PathManager:
         Returns:
             dict: Dictionary mapping path names to their absolute paths.
         """
-        paths = {
-            'data_raw': self.get_data_raw_path(),
-            'data_clean': self.get_data_clean_path(),
-            'data_features': self.get_data_features_path(),
-            'data_events': self.get_data_events_path(),
-            'reports': self.get_reports_path(),
-            'plots': self.get_plots_path(),
-            'logs': self.get_logs_path(),
-        }
+        if self._all_paths is None:
+            self._all_paths = {
+                'data_raw': self.get_data_raw_path(),
+                'data_clean': self.get_data_clean_path(),
+                'data_features': self.get_data_features_path(),
+                'data_events': self.get_data_events_path(),
+                'reports': self.get_reports_path(),
+                'plots': self.get_plots_path(),
+                'logs': self.get_logs_path(),
+            }
+        else:
+            # Paths are resolved once; still recreate any removed directory
+            for path in self._all_paths.values():
+                _ensure_dir(str(path))
         
-        return paths
+        return dict(self._all_paths)
 
 
 # Convenience functions for quick access
@@ -1,7 +1,7 @@
 """Tests for config_loader module."""
 
 import os
-import tempfile
+import shutil
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
@@ -9,26 +9,94 @@ import pytest
 import yaml
 
 from src.config_loader import (
-    Config, PathsConfig, OnsetConfig, load_config,
+    Config, load_config,
     _get_env_overrides, _deep_merge
 )
 from src.utils.paths import PathManager, get_path_manager, ensure_directory
 
 
+# Config file contents used by the YAML loading tests
+YAML_CONFIG = {
+    "onset": {
+        "refractory_s": 90,
+        "confirm_window_s": 25,
+        "score_threshold": 3.0
+    },
+    "paths": {
+        "data_raw": "custom/raw",
+        "reports": "custom/reports"
+    }
+}
+CUSTOM_PATH_CONFIG = {
+    "onset": {"refractory_s": 150}
+}
+INTEGRATION_CONFIG = {
+    "paths": {
+        "data_raw": "integration/raw",
+        "reports": "integration/reports"
+    },
+    "onset": {
+        "refractory_s": 180
+    }
+}
+
+
+def _write_project_config(root: Path, content: dict) -> Path:
+    """Write content as the project's config/onset_default.yaml under root."""
+    config_dir = root / "config"
+    config_dir.mkdir()
+    with open(config_dir / "onset_default.yaml", 'w') as f:
+        yaml.safe_dump(content, f)
+    return root
+
+
+@pytest.fixture(scope="session")
+def yaml_config_dir(tmp_path_factory):
+    """Project root with YAML_CONFIG as its default config file."""
+    return _write_project_config(tmp_path_factory.mktemp("cfg"), YAML_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def custom_config_file(tmp_path_factory):
+    """Standalone config file with CUSTOM_PATH_CONFIG."""
+    config_file = tmp_path_factory.mktemp("custom_cfg") / "custom_config.yaml"
+    with open(config_file, 'w') as f:
+        yaml.safe_dump(CUSTOM_PATH_CONFIG, f)
+    return config_file
+
+
+@pytest.fixture(scope="session")
+def integration_config_dir(tmp_path_factory):
+    """Project root with INTEGRATION_CONFIG as its default config file."""
+    return _write_project_config(tmp_path_factory.mktemp("integration_cfg"), INTEGRATION_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def shared_root(tmp_path_factory):
+    """Project root shared by tests that only resolve paths under it."""
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Default Config, built once for the tests that only read it."""
+    return Config()
+
+
 class TestConfigModels:
     """Test Pydantic models."""
     
-    def test_paths_config_defaults(self):
+    def test_paths_config_defaults(self, default_config):
         """Test PathsConfig default values."""
-        config = PathsConfig()
+        config = default_config.paths
         assert config.data_raw == "data/raw"
         assert config.data_clean == "data/clean"
         assert config.reports == "reports"
         assert config.plots == "reports/plots"
     
-    def test_onset_config_defaults(self):
+    def test_onset_config_defaults(self, default_config):
         """Test OnsetConfig default values."""
-        config = OnsetConfig()
+        config = default_config.onset
         assert config.refractory_s == 120
         assert config.confirm_window_s == 20
         assert config.score_threshold == 2.0
@@ -62,73 +130,40 @@ class TestConfigModels:
 class TestConfigLoader:
     """Test configuration loading functionality."""
     
-    def test_load_config_with_defaults(self):
+    def test_load_config_with_defaults(self, shared_root):
         """Test loading config with all default values."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = load_config(project_root=temp_dir, load_env=False)
-            assert isinstance(config, Config)
-            assert config.onset.refractory_s == 120
-            assert config.paths.data_raw == "data/raw"
+        config = load_config(project_root=shared_root, load_env=False)
+        assert isinstance(config, Config)
+        assert config.onset.refractory_s == 120
+        assert config.paths.data_raw == "data/raw"
     
-    def test_load_config_from_yaml(self):
+    def test_load_config_from_yaml(self, yaml_config_dir):
         """Test loading config from YAML file."""
-        config_content = {
-            "onset": {
-                "refractory_s": 90,
-                "confirm_window_s": 25,
-                "score_threshold": 3.0
-            },
-            "paths": {
-                "data_raw": "custom/raw",
-                "reports": "custom/reports"
-            }
-        }
+        config = load_config(project_root=yaml_config_dir, load_env=False)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create config directory and file
-            config_dir = Path(temp_dir) / "config"
-            config_dir.mkdir()
-            config_file = config_dir / "onset_default.yaml"
-            
-            with open(config_file, 'w') as f:
-                yaml.safe_dump(config_content, f)
-            
-            # Load config
-            config = load_config(project_root=temp_dir, load_env=False)
-            
-            assert config.onset.refractory_s == 90
-            assert config.onset.confirm_window_s == 25
-            assert config.onset.score_threshold == 3.0
-            assert config.paths.data_raw == "custom/raw"
-            assert config.paths.reports == "custom/reports"
+        assert config.onset.refractory_s == 90
+        assert config.onset.confirm_window_s == 25
+        assert config.onset.score_threshold == 3.0
+        assert config.paths.data_raw == "custom/raw"
+        assert config.paths.reports == "custom/reports"
     
-    def test_load_config_with_custom_path(self):
+    def test_load_config_with_custom_path(self, custom_config_file):
         """Test loading config from custom path."""
-        config_content = {
-            "onset": {"refractory_s": 150}
-        }
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            custom_config = Path(temp_dir) / "custom_config.yaml"
-            with open(custom_config, 'w') as f:
-                yaml.safe_dump(config_content, f)
-            
-            config = load_config(config_path=str(custom_config), load_env=False)
-            assert config.onset.refractory_s == 150
+        config = load_config(config_path=str(custom_config_file), load_env=False)
+        assert config.onset.refractory_s == 150
     
     @patch.dict(os.environ, {
         'DATA_RAW_PATH': '/custom/raw',
         'LOG_LEVEL': 'DEBUG',
         'TIMEZONE': 'UTC'
     })
-    def test_load_config_with_env_overrides(self):
+    def test_load_config_with_env_overrides(self, shared_root):
         """Test config loading with environment variable overrides."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = load_config(project_root=temp_dir, load_env=True)
-            
-            assert config.paths.data_raw == '/custom/raw'
-            assert config.logging.level == 'DEBUG'
-            assert config.session.timezone == 'UTC'
+        config = load_config(project_root=shared_root, load_env=True)
+        
+        assert config.paths.data_raw == '/custom/raw'
+        assert config.logging.level == 'DEBUG'
+        assert config.session.timezone == 'UTC'
     
     def test_env_overrides_extraction(self):
         """Test extraction of environment variable overrides."""
@@ -187,13 +222,12 @@ class TestConfigLoader:
 class TestPathManager:
     """Test path management utilities."""
     
-    def test_path_manager_initialization(self):
+    def test_path_manager_initialization(self, shared_root):
         """Test PathManager initialization."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pm = PathManager(project_root=temp_dir)
-            assert pm.project_root == Path(temp_dir)
+        pm = PathManager(project_root=shared_root)
+        assert pm.project_root == shared_root
     
-    def test_path_manager_with_config(self):
+    def test_path_manager_with_config(self, tmp_path):
         """Test PathManager with custom config."""
         config_data = {
             "paths": {
@@ -203,82 +237,98 @@ class TestPathManager:
         }
         config = Config(**config_data)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pm = PathManager(config=config, project_root=temp_dir)
-            
-            raw_path = pm.get_data_raw_path()
-            reports_path = pm.get_reports_path()
-            
-            assert raw_path == Path(temp_dir) / "custom/raw"
-            assert reports_path == Path(temp_dir) / "custom/reports"
-            assert raw_path.exists()  # Should be created
-            assert reports_path.exists()  # Should be created
+        pm = PathManager(config=config, project_root=tmp_path)
+        
+        raw_path = pm.get_data_raw_path()
+        reports_path = pm.get_reports_path()
+        
+        assert raw_path == tmp_path / "custom/raw"
+        assert reports_path == tmp_path / "custom/reports"
+        assert raw_path.exists()  # Should be created
+        assert reports_path.exists()  # Should be created
     
-    def test_absolute_path_conversion(self):
+    def test_absolute_path_conversion(self, shared_root):
         """Test absolute path conversion."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pm = PathManager(project_root=temp_dir)
-            
-            # Test relative path
-            rel_path = "data/test"
-            abs_path = pm.get_absolute_path(rel_path)
-            assert abs_path == Path(temp_dir) / "data/test"
-            
-            # Test already absolute path
-            existing_abs = Path(temp_dir) / "absolute"
-            result = pm.get_absolute_path(existing_abs)
-            assert result == existing_abs
+        pm = PathManager(project_root=shared_root)
+        
+        # Test relative path
+        rel_path = "data/test"
+        abs_path = pm.get_absolute_path(rel_path)
+        assert abs_path == shared_root / "data/test"
+        
+        # Test already absolute path
+        existing_abs = shared_root / "absolute"
+        result = pm.get_absolute_path(existing_abs)
+        assert result == existing_abs
     
-    def test_ensure_dir_exists(self):
+    def test_ensure_dir_exists(self, tmp_path):
         """Test directory creation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pm = PathManager(project_root=temp_dir)
-            
-            test_dir = "test/nested/directory"
-            result_path = pm.ensure_dir_exists(test_dir)
-            
-            expected_path = Path(temp_dir) / test_dir
-            assert result_path == expected_path
-            assert result_path.exists()
-            assert result_path.is_dir()
-    
-    def test_get_file_path(self):
+        pm = PathManager(project_root=tmp_path)
+        
+        test_dir = "test/nested/directory"
+        result_path = pm.ensure_dir_exists(test_dir)
+        
+        expected_path = tmp_path / test_dir
+        assert result_path == expected_path
+        assert result_path.exists()
+        assert result_path.is_dir()
+
+    def test_ensure_dir_exists_skips_existing_dir(self, tmp_path):
+        """Test that an existing directory is not created again."""
+        pm = PathManager(project_root=tmp_path)
+        first = pm.ensure_dir_exists("cached/dir")
+
+        with patch.object(Path, 'mkdir') as mkdir:
+            second = pm.ensure_dir_exists("cached/dir")
+
+        assert second == first
+        mkdir.assert_not_called()
+
+    def test_ensure_dir_exists_recreates_removed_dir(self, tmp_path):
+        """Test that a directory removed after creation is created again."""
+        pm = PathManager(project_root=tmp_path)
+        created = pm.ensure_dir_exists("removed/dir")
+        shutil.rmtree(tmp_path / "removed")
+        
+        result = pm.ensure_dir_exists("removed/dir")
+        
+        assert result == created
+        assert result.is_dir()
+
+    def test_get_file_path(self, tmp_path):
         """Test file path generation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pm = PathManager(project_root=temp_dir)
-            
-            file_path = pm.get_file_path('raw', 'test.csv')
-            expected_path = Path(temp_dir) / "data/raw/test.csv"
-            
-            assert file_path == expected_path
-            assert file_path.parent.exists()  # Directory should be created
+        pm = PathManager(project_root=tmp_path)
+        
+        file_path = pm.get_file_path('raw', 'test.csv')
+        expected_path = tmp_path / "data/raw/test.csv"
+        
+        assert file_path == expected_path
+        assert file_path.parent.exists()  # Directory should be created
     
-    def test_get_file_path_invalid_type(self):
+    def test_get_file_path_invalid_type(self, shared_root):
         """Test file path generation with invalid directory type."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pm = PathManager(project_root=temp_dir)
-            
-            with pytest.raises(ValueError, match="Unknown directory type"):
-                pm.get_file_path('invalid_type', 'test.csv')
+        pm = PathManager(project_root=shared_root)
+        
+        with pytest.raises(ValueError, match="Unknown directory type"):
+            pm.get_file_path('invalid_type', 'test.csv')
     
-    def test_ensure_all_paths(self):
+    def test_ensure_all_paths(self, tmp_path):
         """Test ensuring all configured paths exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pm = PathManager(project_root=temp_dir)
-            
-            paths = pm.ensure_all_paths()
-            
-            # Check that all expected paths are returned
-            expected_keys = {
-                'data_raw', 'data_clean', 'data_features', 'data_events',
-                'reports', 'plots', 'logs'
-            }
-            assert set(paths.keys()) == expected_keys
-            
-            # Check that all paths exist
-            for path in paths.values():
-                assert path.exists()
-                assert path.is_dir()
+        pm = PathManager(project_root=tmp_path)
+        
+        paths = pm.ensure_all_paths()
+        
+        # Check that all expected paths are returned
+        expected_keys = {
+            'data_raw', 'data_clean', 'data_features', 'data_events',
+            'reports', 'plots', 'logs'
+        }
+        assert set(paths.keys()) == expected_keys
+        
+        # Check that all paths exist
+        for path in paths.values():
+            assert path.exists()
+            assert path.is_dir()
 
 
 class TestConvenienceFunctions:
@@ -289,51 +339,31 @@ class TestConvenienceFunctions:
         pm = get_path_manager()
         assert isinstance(pm, PathManager)
     
-    def test_ensure_directory(self):
+    def test_ensure_directory(self, tmp_path):
         """Test ensure_directory convenience function."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_dir = Path(temp_dir) / "test_convenience"
-            result = ensure_directory(test_dir)
-            
-            assert result == test_dir
-            assert test_dir.exists()
+        test_dir = tmp_path / "test_convenience"
+        result = ensure_directory(test_dir)
+        
+        assert result == test_dir
+        assert test_dir.exists()
 
 
 # Integration test
-def test_integration_config_and_paths():
+def test_integration_config_and_paths(integration_config_dir):
     """Test integration between config loading and path management."""
-    config_content = {
-        "paths": {
-            "data_raw": "integration/raw",
-            "reports": "integration/reports"
-        },
-        "onset": {
-            "refractory_s": 180
-        }
-    }
+    # Load config and create path manager
+    config = load_config(project_root=integration_config_dir, load_env=False)
+    pm = PathManager(config=config, project_root=integration_config_dir)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create config file
-        config_dir = Path(temp_dir) / "config"
-        config_dir.mkdir()
-        config_file = config_dir / "onset_default.yaml"
-        
-        with open(config_file, 'w') as f:
-            yaml.safe_dump(config_content, f)
-        
-        # Load config and create path manager
-        config = load_config(project_root=temp_dir, load_env=False)
-        pm = PathManager(config=config, project_root=temp_dir)
-        
-        # Test that paths work correctly
-        raw_path = pm.get_data_raw_path()
-        reports_path = pm.get_reports_path()
-        
-        assert raw_path == Path(temp_dir) / "integration/raw"
-        assert reports_path == Path(temp_dir) / "integration/reports"
-        assert raw_path.exists()
-        assert reports_path.exists()
-        
-        # Test file path generation
-        csv_path = pm.get_file_path('raw', 'data.csv')
-        assert csv_path == Path(temp_dir) / "integration/raw/data.csv"
\ No newline at end of file
+    # Test that paths work correctly
+    raw_path = pm.get_data_raw_path()
+    reports_path = pm.get_reports_path()
+    
+    assert raw_path == integration_config_dir / "integration/raw"
+    assert reports_path == integration_config_dir / "integration/reports"
+    assert raw_path.exists()
+    assert reports_path.exists()
+    
+    # Test file path generation
+    csv_path = pm.get_file_path('raw', 'data.csv')
+    assert csv_path == integration_config_dir / "integration/raw/data.csv"
\ No newline at end of file
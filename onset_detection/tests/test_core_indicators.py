@@ -34,8 +34,7 @@ class TestCoreIndicators:
     
     def test_core_indicators_with_config(self):
         """Test CoreIndicators initialization with custom config."""
-        config = Config()
-        config.features.rolling["vol_window"] = 100
+        config = Config(features={"rolling": {"vol_window": 100, "price_window": 600}})
         
         calculator = CoreIndicators(config)
         assert calculator.vol_window == 100
@@ -208,8 +207,8 @@ class TestCoreIndicators:
             'ask_qty1': [300] * n_rows,
         })
         
-        config = Config()
-        config.features.rolling["vol_window"] = 50  # Use smaller window for test
+        # Use smaller window for test
+        config = Config(features={"rolling": {"vol_window": 50, "price_window": 600}})
         calculator = CoreIndicators(config)
         
         result_df = calculator.add_indicators(df)
@@ -239,7 +238,66 @@ class TestCoreIndicators:
         
         for indicator in expected_indicators:
             assert indicator in result_df.columns
+    
+    def test_add_indicators_without_copy(self):
+        """Test that copy=False gives the same result and copy=True leaves input intact."""
+        df = self.create_sample_data(20)
+        original_columns = list(df.columns)
+        calculator = CoreIndicators()
+        
+        copied = calculator.add_indicators(df)
+        assert list(df.columns) == original_columns
+        
+        in_place = calculator.add_indicators(df.copy(), copy=False)
+        pd.testing.assert_frame_equal(in_place, copied)
 
+    
+    @pytest.mark.parametrize("is_cumulative", [True, False])
+    def test_live_kernel_matches_latest_row(self, is_cumulative):
+        """Test that the live latest-row kernel reproduces the last indicator row."""
+        from src.features._live_kernels import latest_features, LATEST_FEATURE_NAMES
+        
+        df = self.create_sample_data(120)
+        # Several ticks per second so per-second aggregation is exercised
+        df['ts'] = 1704067200000 + np.arange(len(df)) * 400
+        
+        config = Config(volume={"is_cumulative": is_cumulative})
+        expected = calculate_core_indicators(df, config).iloc[-1]
+        
+        arrays = [df[c].to_numpy(dtype=np.float64)
+                  for c in ('price', 'volume', 'bid1', 'ask1', 'bid_qty1', 'ask_qty1')]
+        ts_sec = (df['ts'].to_numpy() // 1000).astype(np.int64)
+        values = latest_features(*arrays, ts_sec, is_cumulative, config.volume.roll_window_s)
+        
+        for name, value in zip(LATEST_FEATURE_NAMES, values):
+            assert value == pytest.approx(expected[name], rel=1e-9, abs=1e-9), name
+    
+    def test_rolling_second_volume_matches_buffer(self):
+        """Test O(1) running volume stats against recomputation over the buffer."""
+        from src.features._live_kernels import RollingSecondVolume
+        
+        buffer_size = 50
+        config = Config(volume={"roll_window_s": 20})
+        stats = RollingSecondVolume(config.volume.roll_window_s, is_cumulative=True)
+        
+        df = self.create_sample_data(200)
+        df['ts'] = 1704067200000 + np.arange(len(df)) * 700
+        rng = np.random.default_rng(0)
+        df['volume'] = np.cumsum(rng.integers(0, 500, len(df)))
+        
+        for i in range(len(df)):
+            if i >= buffer_size:
+                stats.evict()
+            stats.push(int(df['ts'].iloc[i] // 1000), float(df['volume'].iloc[i]))
+        
+        window = df.iloc[-buffer_size:].reset_index(drop=True)
+        expected = calculate_core_indicators(window, config).iloc[-1]
+        vol_1s, ticks_per_sec, z_vol = stats.latest()
+        
+        assert vol_1s == pytest.approx(expected['vol_1s'])
+        assert ticks_per_sec == expected['ticks_per_sec']
+        assert z_vol == pytest.approx(expected['z_vol_1s'], rel=1e-7, abs=1e-7)
+        assert stats.valid
 
 class TestCoreIndicatorsIntegration:
     """Test integration with other components."""
@@ -81,6 +81,44 @@ class TestEventStore:
                     saved_event = json.loads(line.strip())
                     assert saved_event['event_type'] == events[i]['event_type']
     
+    def test_save_events_batch(self):
+        """Test saving a batch of events in one write."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = EventStore(path=temp_dir)
+            
+            events = [
+                self.create_test_event("onset_candidate"),
+                self.create_test_event("onset_confirmed")
+            ]
+            
+            assert store.save_events(events, fsync=True) == 2
+            assert store.save_events([]) == 0
+            
+            loaded = store.load_events()
+            assert [e['event_type'] for e in loaded] == ["onset_candidate", "onset_confirmed"]
+            assert all('saved_at' in e for e in loaded)
+            assert store.get_stats()['total_events'] == 2
+            
+            # Invalid event rejects the whole batch
+            with pytest.raises(ValueError):
+                store.save_events([self.create_test_event(), {'event_type': 'no_ts'}])
+            assert len(store.load_events()) == 2
+    
+    def test_event_appender(self):
+        """Test appending batches through a long-lived appender."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = EventStore(path=temp_dir)
+            
+            with store.appender() as out:
+                assert out.write([self.create_test_event("trade_entry")]) == 1
+                assert out.write([]) == 0
+                assert out.write([self.create_test_event("trade_exit")] * 2) == 2
+                out.sync()
+            
+            loaded = store.load_events()
+            assert [e['event_type'] for e in loaded] == ["trade_entry", "trade_exit", "trade_exit"]
+            assert store.get_stats()['total_events'] == 3
+    
     def test_load_events_basic(self):
         """Test basic event loading functionality."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -302,8 +340,7 @@ class TestLogger:
         """Test Logger initialization."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Create a temporary config with custom log path
-            config = Config()
-            config.paths.logs = temp_dir
+            config = Config(paths={"logs": temp_dir})
             
             logger_system = Logger(config)
             assert logger_system.logs_dir == Path(temp_dir)
@@ -311,8 +348,7 @@ class TestLogger:
     def test_get_logger(self):
         """Test getting logger instances."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config()
-            config.paths.logs = temp_dir
+            config = Config(paths={"logs": temp_dir})
             
             logger_system = Logger(config)
             
@@ -363,8 +399,7 @@ class TestLogger:
     def test_set_level(self):
         """Test changing log level."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config()
-            config.paths.logs = temp_dir
+            config = Config(paths={"logs": temp_dir})
             
             logger_system = Logger(config)
             
@@ -383,9 +418,7 @@ class TestLoggingIntegration:
         """Test using event store with logging enabled."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Setup paths
-            config = Config()
-            config.paths.logs = temp_dir
-            config.paths.data_events = temp_dir
+            config = Config(paths={"logs": temp_dir, "data_events": temp_dir})
             
             # Create event store (this is the main functionality we're testing)
             store = EventStore(config=config)
@@ -3,6 +3,7 @@
 import json
 import pandas as pd
 import tempfile
+import warnings
 from pathlib import Path
 import pytest
 
@@ -112,11 +113,67 @@ class TestPlotReporter:
             loaded_data = reporter.load_price_data(csv_path)
             
             assert len(loaded_data) == 20
-            assert 'datetime' in loaded_data.columns
+            assert 'datetime' not in loaded_data.columns
             assert 'ts' in loaded_data.columns
             assert 'price' in loaded_data.columns
             assert 'stock_code' in loaded_data.columns
     
+    def test_load_price_data_parquet_cache(self):
+        """Test that a parquet sidecar is written and reused on reload."""
+        pytest.importorskip("pyarrow")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "cached_prices.csv"
+            self.create_sample_price_data(20).to_csv(csv_path, index=False)
+            
+            reporter = PlotReporter()
+            first = reporter.load_price_data(csv_path)
+            
+            parquet_path = Path(tmp_dir) / "cached_prices.csv.parquet"
+            assert parquet_path.exists()
+            
+            second = reporter.load_price_data(csv_path)
+            pd.testing.assert_frame_equal(first[['ts', 'stock_code', 'price']], second)
+            assert second['stock_code'].iloc[0] == '005930'
+    
+    def test_load_price_data_ignores_mismatched_parquet(self, tmp_path):
+        """Test that a sidecar without the price columns falls back to the CSV."""
+        pytest.importorskip("pyarrow")
+        
+        csv_path = tmp_path / "prices.csv"
+        sample_data = self.create_sample_price_data(20)
+        sample_data.to_csv(csv_path, index=False)
+        
+        # Newer sidecar holding unrelated data, e.g. a features dump
+        parquet_path = tmp_path / "prices.csv.parquet"
+        pd.DataFrame({'ts': [1], 'ret_1s': [0.1]}).to_parquet(parquet_path)
+        
+        reporter = PlotReporter()
+        loaded = reporter.load_price_data(csv_path)
+        
+        assert len(loaded) == 20
+        assert loaded['price'].tolist() == sample_data['price'].astype(float).tolist()
+        
+        # The sidecar is rewritten from the CSV and used from then on
+        cached = reporter.load_price_data(csv_path)
+        assert list(cached.columns) == ['ts', 'stock_code', 'price']
+        assert len(cached) == 20
+    
+    def test_load_price_data_keeps_user_parquet(self, tmp_path):
+        """Test that a user's '<stem>.parquet' next to the CSV is left alone."""
+        pytest.importorskip("pyarrow")
+        
+        csv_path = tmp_path / "prices.csv"
+        self.create_sample_price_data(20).to_csv(csv_path, index=False)
+        user_parquet = tmp_path / "prices.parquet"
+        user_data = pd.DataFrame({'ts': [1], 'stock_code': ['000660'], 'price': [1.0]})
+        user_data.to_parquet(user_parquet)
+        
+        loaded = PlotReporter().load_price_data(csv_path)
+        
+        assert len(loaded) == 20
+        pd.testing.assert_frame_equal(pd.read_parquet(user_parquet), user_data)
+    
     def test_load_price_data_missing_file(self):
         """Test loading price data from non-existent file."""
         reporter = PlotReporter()
@@ -141,6 +198,28 @@ class TestPlotReporter:
             with pytest.raises(ValueError):
                 reporter.load_price_data(csv_path)
     
+    def test_load_price_groups_memoized(self):
+        """Test per-stock price grouping and its per-file cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "multi_prices.csv"
+            
+            price_data = self.create_sample_price_data(20)
+            price_data.loc[10:, 'stock_code'] = '000660'
+            price_data.to_csv(csv_path, index=False)
+            
+            reporter = PlotReporter()
+            loaded, groups = reporter.load_price_groups(csv_path)
+            
+            assert len(loaded) == 20
+            assert sorted(groups) == ['000660', '005930']
+            assert len(groups['005930']) == 10
+            assert len(groups['000660']) == 10
+            
+            # Second call hits the cache
+            loaded_again, groups_again = reporter.load_price_groups(csv_path)
+            assert loaded_again is loaded
+            assert groups_again is groups
+    
     def test_load_events_from_files(self):
         """Test loading events from JSONL files."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -174,6 +253,21 @@ class TestPlotReporter:
             for event in loaded_events:
                 assert 'datetime' in event
     
+    def test_load_events_with_null_ts(self, tmp_path):
+        """Test that events with a null ts load alongside numeric ones."""
+        events_file = tmp_path / "events.jsonl"
+        events_file.write_text(
+            '{"ts": 1704067200000, "event_type": "onset_candidate", "stock_code": "005930"}\n'
+            '{"ts": null, "event_type": "onset_confirmed", "stock_code": "005930"}\n'
+        )
+        
+        reporter = PlotReporter()
+        loaded_events = reporter.load_events_from_files([events_file])
+        
+        assert len(loaded_events) == 2
+        assert loaded_events[0]['datetime'] == pd.Timestamp('2024-01-01')
+        assert loaded_events[1]['datetime'] is None
+    
     def test_load_labels_data_valid_csv(self):
         """Test loading valid labels data."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -191,6 +285,23 @@ class TestPlotReporter:
             assert 'datetime_start' in loaded_labels.columns
             assert 'datetime_end' in loaded_labels.columns
     
+    def test_load_labels_data_missing_end(self, tmp_path):
+        """Test that a label without timestamp_end gets a NaT end time."""
+        labels_path = tmp_path / "open_labels.csv"
+        sample_labels = self.create_sample_labels()
+        sample_labels['timestamp_end'] = [sample_labels['timestamp_end'][0], None]
+        sample_labels.to_csv(labels_path, index=False)
+        
+        reporter = PlotReporter()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            loaded_labels = reporter.load_labels_data(labels_path)
+        
+        assert loaded_labels is not None
+        assert loaded_labels['datetime_end'].iloc[0] == pd.to_datetime(1704067220000, unit='ms')
+        assert pd.isna(loaded_labels['datetime_end'].iloc[1])
+        assert loaded_labels['datetime_start'].notna().all()
+    
     def test_load_labels_data_missing_file(self):
         """Test loading labels data from non-existent file."""
         reporter = PlotReporter()
@@ -224,6 +335,62 @@ class TestPlotReporter:
         assert len(filtered['confirmations']) >= 0
         assert len(filtered['rejections']) >= 0
     
+    def test_filter_events_exact_bounds_and_stock(self):
+        """Test that time bounds are inclusive and other stocks are excluded."""
+        reporter = PlotReporter()
+        events = self.create_sample_events()
+        events.append({
+            'ts': 1704067200000 + 10000,
+            'event_type': 'onset_candidate',
+            'stock_code': '000660',
+            'score': 2.5
+        })
+        
+        for event in events:
+            event['datetime'] = pd.to_datetime(event['ts'], unit='ms')
+        
+        # Window starts exactly on the second candidate and ends on the last confirmation
+        filtered = reporter.filter_events_by_stock_and_timerange(
+            events, '005930',
+            pd.to_datetime(1704067200000 + 25000, unit='ms'),
+            pd.to_datetime(1704067200000 + 50000, unit='ms')
+        )
+        
+        assert [e['ts'] for e in filtered['candidates']] == [1704067225000, 1704067245000]
+        assert [e['ts'] for e in filtered['confirmations']] == [1704067250000]
+        assert [e['ts'] for e in filtered['rejections']] == [1704067230000]
+    
+    def test_filter_event_frame_matches_list_filter(self):
+        """Test that filtering an event frame matches filtering the event list."""
+        reporter = PlotReporter()
+        events = self.create_sample_events()
+        for event in events:
+            event['datetime'] = pd.to_datetime(event['ts'], unit='ms')
+        
+        frame = reporter.events_to_frame(events)
+        assert str(frame['event_type'].dtype) == 'category'
+        assert str(frame['datetime'].dtype) == 'datetime64[ns]'
+        
+        start_time = pd.to_datetime(1704067200000 + 25000, unit='ms')
+        end_time = pd.to_datetime(1704067200000 + 50000, unit='ms')
+        from_list = reporter.filter_events_by_stock_and_timerange(events, '005930', start_time, end_time)
+        from_frame = reporter.filter_events_by_stock_and_timerange(frame, '005930', start_time, end_time)
+        
+        for category in ('candidates', 'confirmations', 'rejections'):
+            assert from_frame[category]['ts'].tolist() == [e['ts'] for e in from_list[category]]
+    
+    def test_events_to_frame_skips_null_ts(self):
+        """Test that events without a usable ts are left out of the frame."""
+        reporter = PlotReporter()
+        events = self.create_sample_events()
+        events.append({'ts': None, 'event_type': 'onset_candidate', 'stock_code': '005930'})
+        events.append({'event_type': 'onset_candidate', 'stock_code': '005930'})
+        
+        frame = reporter.events_to_frame(events)
+        
+        assert len(frame) == len(events) - 2
+        assert frame['ts'].tolist() == [e['ts'] for e in events[:-2]]
+    
     def test_create_plot_basic(self):
         """Test basic plot creation."""
         reporter = PlotReporter()
@@ -257,6 +424,27 @@ class TestPlotReporter:
         import matplotlib.pyplot as plt
         plt.close(fig)
     
+    def test_create_plot_downsamples_dense_price_line(self):
+        """Test that dense price series are downsampled before plotting."""
+        reporter = PlotReporter()
+        
+        price_data = self.create_sample_price_data(20000)
+        price_data['datetime'] = pd.to_datetime(price_data['ts'], unit='ms')
+        events = {'candidates': [], 'confirmations': [], 'rejections': []}
+        
+        fig, ax = reporter.create_plot(price_data, events, stock_code='005930')
+        
+        line = ax.get_lines()[0]
+        max_points = int(fig.get_size_inches()[0] * fig.dpi)
+        assert len(line.get_xdata()) <= max_points
+        assert len(line.get_ydata()) > 2
+        # Endpoints survive downsampling
+        assert line.get_ydata()[0] == price_data['price'].iloc[0]
+        assert line.get_ydata()[-1] == price_data['price'].iloc[-1]
+        
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    
     def test_create_plot_with_labels(self):
         """Test plot creation with labels."""
         reporter = PlotReporter()
@@ -357,6 +545,41 @@ class TestPlotReporter:
             assert summary['labels_count'] == 2
             assert output_path.exists()
     
+    def test_generate_report_reuses_figure(self):
+        """Test generating several reports into one shared figure."""
+        import matplotlib.pyplot as plt
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            
+            csv_path = tmp_path / "prices.csv"
+            events_path = tmp_path / "events.jsonl"
+            self.create_sample_price_data(30).to_csv(csv_path, index=False)
+            with open(events_path, 'w') as f:
+                for event in self.create_sample_events():
+                    json.dump(event, f)
+                    f.write('\n')
+            
+            reporter = PlotReporter()
+            fig = plt.figure(figsize=(14, 8))
+            
+            for i in range(2):
+                output_path = tmp_path / f"report_{i}.png"
+                summary = reporter.generate_report(
+                    csv_path=csv_path,
+                    event_files=[events_path],
+                    output_path=output_path,
+                    stock_code='005930',
+                    fig=fig
+                )
+                
+                assert summary['save_success'] == True
+                assert output_path.exists()
+                # Previous report's axes are cleared, not stacked
+                assert len(fig.axes) == 1
+            
+            plt.close(fig)
+    
     def test_generate_report_missing_csv(self):
         """Test report generation with missing CSV file."""
         reporter = PlotReporter()
@@ -429,7 +652,10 @@ class TestPlotReporter:
                 output_path=output_path
             )
             
-            # Should handle empty data gracefully
+            # Should handle empty data gracefully; nothing to draw, so plotting is skipped
             assert "error" not in summary
             assert summary['price_data_points'] == 0
-            assert summary['save_success'] == True
\ No newline at end of file
+            assert summary['skipped'] == True
+            assert summary['save_success'] == False
+            assert not output_path.exists()
+
@@ -122,10 +122,11 @@ class TestQualityReporter:
     
     def test_quality_reporter_with_custom_config(self):
         """Test QualityReporter initialization with custom config."""
-        config = Config()
-        config.refractory.duration_s = 60
-        config.confirm.window_s = 30
-        config.detection.score_threshold = 3.0
+        config = Config(
+            refractory={"duration_s": 60},
+            confirm={"window_s": 30},
+            detection={"score_threshold": 3.0}
+        )
         
         reporter = QualityReporter(config)
         
@@ -225,6 +226,43 @@ class TestQualityReporter:
         assert report['tta_median'] == 15.0
         assert report['tta_p95'] == 15.0
     
+    def test_analyze_events_large_batch_matches_loop(self):
+        """Test that the pandas path for large batches matches the loop path."""
+        events = self.create_sample_events("basic") * 1000
+        events.append({'ts': 1704067200000})  # Missing event_type
+        
+        reporter = QualityReporter()
+        assert len(events) > reporter.FRAME_ANALYSIS_MIN_EVENTS
+        frame_report = reporter.analyze_events(events)
+        
+        reporter.FRAME_ANALYSIS_MIN_EVENTS = len(events)
+        loop_report = reporter.analyze_events(events)
+        
+        assert frame_report == loop_report
+        assert frame_report['event_types']['unknown'] == 1
+        assert frame_report['stocks_analyzed'] == 2
+        assert frame_report['tta_min'] == 5.0
+    
+    def test_frame_and_loop_paths_treat_nulls_alike(self):
+        """Test that null fields give the same categorization on both paths."""
+        events = self.create_sample_events("basic") + [
+            {'ts': 1704067200000, 'event_type': None, 'stock_code': '005930'},
+            {'ts': 1704067201000, 'event_type': 'onset_candidate', 'stock_code': None},
+            {'ts': None, 'event_type': 'onset_confirmed', 'stock_code': '000660',
+             'confirmed_from': 1704067200000},
+        ]
+        
+        reporter = QualityReporter()
+        loop_types, loop_at, loop_from, loop_stocks = reporter._categorize_events(events)
+        frame_types, frame_at, frame_from, frame_stocks = reporter._categorize_events_frame(events)
+        
+        assert loop_types == frame_types
+        assert loop_types['unknown'] == 1
+        assert None not in loop_types
+        assert loop_at == frame_at.tolist()
+        assert loop_from == frame_from.tolist()
+        assert loop_stocks == frame_stocks
+    
     def test_load_events_from_files(self):
         """Test loading events from JSONL files."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -260,6 +298,57 @@ class TestQualityReporter:
             original_timestamps = [e['ts'] for e in original_events]
             assert sorted(loaded_timestamps) == sorted(original_timestamps)
     
+    def test_generate_incremental_report(self):
+        """Test that incremental reports fold in appended events only."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            event_file = Path(tmp_dir) / "events.jsonl"
+            events = self.create_sample_events("basic")
+            
+            with open(event_file, 'w') as f:
+                for event in events[:3]:
+                    f.write(json.dumps(event) + '\n')
+                # Partial line still being written
+                f.write(json.dumps(events[3])[:10])
+            
+            reporter = QualityReporter()
+            report = reporter.generate_incremental_report([event_file])
+            assert report['total_events'] == 3
+            assert report['n_candidates'] == 2
+            
+            with open(event_file, 'a') as f:
+                f.write(json.dumps(events[3])[10:] + '\n')
+                for event in events[4:]:
+                    f.write(json.dumps(event) + '\n')
+            
+            report = reporter.generate_incremental_report([event_file])
+            assert report == reporter.analyze_events(events)
+            
+            # Truncated file resets the running state
+            with open(event_file, 'w') as f:
+                f.write(json.dumps(events[0]) + '\n')
+            
+            report = reporter.generate_incremental_report([event_file])
+            assert report['total_events'] == 1
+    
+    def test_generate_report_arrow_path_matches_dict_path(self):
+        """Test that large-file Arrow analysis matches line-by-line parsing."""
+        pytest.importorskip("pyarrow.json")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            event_file = Path(tmp_dir) / "events.jsonl"
+            with open(event_file, 'w') as f:
+                for event in self.create_sample_events("basic"):
+                    f.write(json.dumps(event) + '\n')
+                f.write(json.dumps({'ts': 1704067200000}) + '\n')  # Missing event_type
+            
+            reporter = QualityReporter()
+            reporter.ARROW_ANALYSIS_MIN_BYTES = 0
+            arrow_report = reporter.generate_report(event_files=[event_file])
+            
+            events = reporter.load_events_from_files([event_file])
+            assert arrow_report == reporter.analyze_events(events)
+            assert arrow_report['event_types']['unknown'] == 1
+    
     def test_load_events_from_nonexistent_files(self):
         """Test loading events from non-existent files."""
         reporter = QualityReporter()
@@ -362,10 +451,11 @@ class TestQualityReporter:
     
     def test_config_in_report(self):
         """Test that configuration is included in report."""
-        config = Config()
-        config.refractory.duration_s = 90
-        config.confirm.window_s = 25
-        config.detection.score_threshold = 2.5
+        config = Config(
+            refractory={"duration_s": 90},
+            confirm={"window_s": 25},
+            detection={"score_threshold": 2.5}
+        )
         
         reporter = QualityReporter(config)
         events = self.create_sample_events("basic")